@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 
 
 class Instrument(ABC):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
@@ -1,7 +1,11 @@
 import ctypes
 import enum
+import functools
+import math
 import pathlib
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from helpers import DllBinder
 import sys
 import os
@@ -70,6 +74,15 @@ class Wavelengths(enum.IntEnum):
 CWD = pathlib.Path(__file__).resolve().parent
 os.add_dll_directory(CWD / "dll")
 DLL_NAME = "OP710M_64.dll"
+DLL_PATH = CWD / "dll" / DLL_NAME
+_C_DOUBLE_SIZE = ctypes.sizeof(ctypes.c_double)
+
+# 10**(x/10) == exp(x * ln(10)/10), cheaper than a generic pow
+_LN10_OVER_10 = math.log(10) / 10
+
+# Channel sets; gain and autorange are shared by adjacent (odd, even) pairs
+_ALL_CHANNELS = tuple(range(1, 25))
+_ODD_CHANNELS = tuple(range(1, 25, 2))
 
 
 class SantecDLL:
@@ -81,7 +94,7 @@ class SantecDLL:
     - translating error codes into Python exceptions
     """
 
-    def __init__(self, dll_name: str | pathlib.Path = DLL_NAME):
+    def __init__(self, dll_name: str | pathlib.Path = DLL_PATH):
         self._dll_name = dll_name
         self._dll: Optional[ctypes.CDLL] = None
         self._load()
@@ -128,7 +141,10 @@ class SantecDLL:
         binder.bind(self, "GetFWRevision", ctypes.c_int, ())
         binder.bind(self, "GetChannelBuffer", ctypes.c_int, ())
         binder.bind(
-            self, "GetUSBStatus", ctypes.c_int, (ctypes.POINTER(ctypes.c_bool),)
+            self,
+            "GetUSBStatus",
+            ctypes.c_int,
+            (ctypes.c_int, ctypes.POINTER(ctypes.c_bool)),
         )
         binder.bind(
             self,
@@ -224,6 +240,46 @@ class SantecDLL:
             (ctypes.c_int, ctypes.POINTER(ctypes.c_uint64)),
         )
 
+    def read_channel_buffers(
+        self, channels: Sequence[int], out: ctypes.Array
+    ) -> Tuple[int, int]:
+        """
+        Read the buffered power of several channels into a contiguous buffer.
+
+        The whole channel loop runs here, so callers cross the Python/ctypes
+        boundary once per channel with no intermediate Python objects.
+
+        Parameters
+        ----------
+        channels : Sequence[int]
+            Channels to read (1-based).
+        out : ctypes.Array
+            ``c_double`` array with at least ``len(channels)`` elements,
+            filled with the dBm value of each channel.
+
+        Returns
+        -------
+        tuple[int, int]
+            ``(channel, code)`` of the first failed read, ``(0, 0)`` on success.
+        """
+        read = self.ReadChannelBuffer
+        byref = ctypes.byref
+        # The declared argtype is POINTER(c_double): pass each slot as a
+        # c_double sharing the array memory, not as an offset into the array
+        slot = ctypes.c_double.from_buffer
+        size = _C_DOUBLE_SIZE
+        for i, ch in enumerate(channels):
+            ret = read(ch, byref(slot(out, i * size)))
+            if ret != 0 and ret != 1:
+                return ch, ret
+        return 0, 0
+
+
+@functools.lru_cache(maxsize=None)
+def _default_dll() -> SantecDLL:
+    """Load the shared SantecDLL instance on first use."""
+    return SantecDLL()
+
 
 class OPM150(Instrument):
     """
@@ -240,6 +296,10 @@ class OPM150(Instrument):
     verbose : bool, optional
         If ``True``, prints detailed information and communication messages
         to the console (default is ``True``).
+    checked : bool, optional
+        If ``True`` (default), DLL return codes are validated and failures
+        raise. ``False`` skips the validation, for tight loops on trusted
+        hardware.
 
     Attributes
     ----------
@@ -276,20 +336,73 @@ class OPM150(Instrument):
     - Channel switching requires a short delay (~0.1 s) between commands.
     - Power unit conversion (dBm ↔ W) is handled internally.
     - Autorange and gain settings are shared between adjacent channels.
+    - Passing ``checked=False`` disables the validation of DLL return codes
+      for that instance.
     """
 
+    # Wavelengths enum supported by the DLL, shared by all instances
+    available_wavelengths = Wavelengths
+
+    __slots__ = (
+        "verbose",
+        "power_unit",
+        "checked",
+        "device_number",
+        "_dll",
+        "_GetActiveChannel",
+        "_SetActiveChannel",
+        "_ReadAnalog",
+        "_ConvertPower",
+        "_GetChannelBuffer",
+        "_ReadChannelBuffer",
+        "_SetAutoRange",
+        "_SetGain",
+        "_read_channel_buffers",
+        "_handle",
+        "_is_connection_open",
+        "_sampling_speed",
+        "remote_mode",
+        "_active_channel_cache",
+        "_sweep_ready_at",
+        "_sc_powers",
+        "_sc_powers_view",
+        "_sc_temp",
+        "_sc_power",
+        "_sc_bool",
+        "_sc_int1",
+        "_sc_int2",
+        "_sc_int3",
+        "_sc_char_p",
+        "_sc_temp_ref",
+        "_sc_power_ref",
+        "_sc_bool_ref",
+        "_sc_int1_ref",
+        "_sc_int2_ref",
+        "_sc_int3_ref",
+        "_sc_char_p_ref",
+    )
+
     def __init__(
-        self, dll: SantecDLL = SantecDLL(), verbose: bool = True, power_unit=1
+        self,
+        dll: Optional[SantecDLL] = None,
+        verbose: bool = True,
+        power_unit=1,
+        checked: bool = True,
     ):
         """
         Initialize communication with the OPM150 (OP-710 family).
 
         Parameters
         ----------
+        dll : SantecDLL, optional
+            DLL wrapper to use. Defaults to a process-wide instance, loaded on
+            first use.
         verbose : bool
             If True, prints important status messages prefixed with [OPM150].
             Detailed debug prints are also emitted to the logger and to stdout
             when verbose is True.
+        checked : bool
+            If False, DLL return codes are not validated.
 
         Behaviour
         ---------
@@ -299,13 +412,48 @@ class OPM150(Instrument):
         """
         self.verbose = verbose
         self.power_unit = power_unit
+        self.checked = checked
         self.device_number = None
-        self.available_wavelengths = Wavelengths  # available wavelengths enum from DLL
         # self.active_channel = 1 # ensure active_channel is set explicitly (DLL getter may reset on reopen)
+        if dll is None:
+            dll = _default_dll()
         self._dll = dll
 
+        # Hot-path DLL entry points, cached to skip the lookup on the wrapper
+        self._GetActiveChannel = dll.GetActiveChannel
+        self._SetActiveChannel = dll.SetActiveChannel
+        self._ReadAnalog = dll.ReadAnalog
+        self._ConvertPower = dll.ConvertPower
+        self._GetChannelBuffer = dll.GetChannelBuffer
+        self._ReadChannelBuffer = dll.ReadChannelBuffer
+        self._SetAutoRange = dll.SetAutoRange
+        self._SetGain = dll.SetGain
+        self._read_channel_buffers = dll.read_channel_buffers
+
         self._is_connection_open = False
         self._sampling_speed = None  # probably channel-related; untested here
+        self._active_channel_cache = None  # mirror of the last known active channel
+        self._sweep_ready_at = None  # settling deadline of the pending sweep
+
+        # Scratch output slots reused by the scalar getters
+        self._sc_temp = ctypes.c_double()
+        self._sc_power = ctypes.c_double()
+        self._sc_bool = ctypes.c_bool()
+        self._sc_int1 = ctypes.c_int()
+        self._sc_int2 = ctypes.c_int()
+        self._sc_int3 = ctypes.c_int()
+        self._sc_char_p = ctypes.c_char_p()
+        self._sc_temp_ref = ctypes.byref(self._sc_temp)
+        self._sc_power_ref = ctypes.byref(self._sc_power)
+        self._sc_bool_ref = ctypes.byref(self._sc_bool)
+        self._sc_int1_ref = ctypes.byref(self._sc_int1)
+        self._sc_int2_ref = ctypes.byref(self._sc_int2)
+        self._sc_int3_ref = ctypes.byref(self._sc_int3)
+        self._sc_char_p_ref = ctypes.byref(self._sc_char_p)
+
+        # Scratch buffer shared by multi-channel reads, with a NumPy view on it
+        self._sc_powers = (ctypes.c_double * 24)()
+        self._sc_powers_view = np.frombuffer(self._sc_powers, dtype=np.float64)
         self.remote_mode = True
 
         self.connect()
@@ -313,7 +461,7 @@ class OPM150(Instrument):
 
     def connect(self):
         device_count = self.USB_device_count
-        logger.debug(f"Device count : {device_count}")
+        logger.debug("Device count : %d", device_count)
 
         self.device_number = next(
             (
@@ -327,13 +475,16 @@ class OPM150(Instrument):
             logger.error("No OP710 device found.")
             raise RuntimeError("No OP710 device found.")
         else:
-            logger.debug(f"Device number : {self.device_number}")
+            logger.debug("Device number : %d", self.device_number)
+
+        # the DLL may reset the active channel on reopen
+        self.invalidate_channel_cache()
 
         # open USB device and driver
         self._handle = self.open_USB_device(self.device_number)
-        logger.debug(f"USB Handle : {self._handle}")
+        logger.debug("USB Handle : %d", self._handle)
         self._is_connection_open = self.open_driver(self._handle)
-        logger.debug(f"Is connection open : {self._is_connection_open}")
+        logger.debug("Is connection open : %s", self._is_connection_open)
         logger.info(f"Power Meter {self._handle} is connected.")
 
     def close(self) -> None:
@@ -349,7 +500,7 @@ class OPM150(Instrument):
             _ret = self._dll.CloseDriver()
             self._check("CloseDriver", _ret)
             self._is_connection_open = False
-            self.logger.info("Power meter connection has been closed.")
+            logger.info("Power meter connection has been closed.")
 
     def get_module_USB_handle(self, module: int) -> int:
         """
@@ -366,8 +517,8 @@ class OPM150(Instrument):
             USB handle if module active, otherwise returns 0 (or a module-specific value).
         """
 
-        handle = self._dll.ActiveModule(ctypes.c_int(module))
-        self.logger.debug(f"ActiveModule({module}) -> {handle}")
+        handle = self._dll.ActiveModule(module)
+        logger.debug("ActiveModule(%d) -> %d", module, handle)
         return handle
 
     def open_USB_device(self, dev_number: int) -> int:
@@ -385,10 +536,10 @@ class OPM150(Instrument):
             Numeric USB handle for use with `open_driver`.
         """
         handle = ctypes.c_uint64()
-        _ret = self._dll.OpenUSBDevice(ctypes.c_int(dev_number), ctypes.byref(handle))
+        _ret = self._dll.OpenUSBDevice(dev_number, ctypes.byref(handle))
         self._check("OpenUSBDevice", _ret)
-        self.logger.debug(
-            f"OpenUSBDevice(dev_number={dev_number}) -> handle={handle.value}"
+        logger.debug(
+            "OpenUSBDevice(dev_number=%d) -> handle=%d", dev_number, handle.value
         )
         return handle.value
 
@@ -407,7 +558,7 @@ class OPM150(Instrument):
         bool
             True on success, False otherwise.
         """
-        _ret = self._dll.OpenDriver(ctypes.c_uint64(handle))
+        _ret = self._dll.OpenDriver(handle)
         self._check("OpenDriver", _ret)
         return _ret == 0
 
@@ -421,10 +572,9 @@ class OPM150(Instrument):
         int
             Number of connected devices compatible with the DLL.
         """
-        _count = ctypes.c_int()
-        _ret = self._dll.GetUSBDeviceCount(ctypes.byref(_count))
+        _ret = self._dll.GetUSBDeviceCount(self._sc_int1_ref)
         self._check("GetUSBDeviceCount", _ret)
-        return _count.value
+        return self._sc_int1.value
 
     def get_USB_device_description(self, dev_number: int) -> str:
         """
@@ -440,14 +590,10 @@ class OPM150(Instrument):
         str
             UTF-8 decoded device description (up to 16 chars per DLL).
         """
-        _description = ctypes.c_char_p()
-        _dev_number = ctypes.c_int(dev_number)
-        _ret = self._dll.GetUSBDeviceDescription(
-            _dev_number, ctypes.byref(_description)
-        )
+        _ret = self._dll.GetUSBDeviceDescription(dev_number, self._sc_char_p_ref)
         self._check("GetUSBDeviceDescription", _ret)
-        desc = _description.value.decode("UTF-8")
-        logger.debug(f"Device[{dev_number}] description: {desc}")
+        desc = self._sc_char_p.value.decode("UTF-8")
+        logger.debug("Device[%d] description: %s", dev_number, desc)
         return desc
 
     @property
@@ -460,11 +606,9 @@ class OPM150(Instrument):
         str
             Serial number string (8 characters).
         """
-        _serial = ctypes.c_char_p()
-        _device_number = ctypes.c_int(self.device_number)
-        _ret = self._dll.GetUSBSerialNumber(_device_number, ctypes.byref(_serial))
+        _ret = self._dll.GetUSBSerialNumber(self.device_number, self._sc_char_p_ref)
         self._check("GetUSBSerialNumber", _ret)
-        return _serial.value.decode("UTF-8")
+        return self._sc_char_p.value.decode("UTF-8")
 
     @property
     def USB_status(self) -> bool:
@@ -476,27 +620,33 @@ class OPM150(Instrument):
         bool
             True if an error flag is set, False otherwise.
         """
-        _have_error = ctypes.c_bool()
-        _device_number = ctypes.c_int(self.device_number)
-        _ret = self._dll.GetUSBStatus(_device_number, ctypes.byref(_have_error))
+        _ret = self._dll.GetUSBStatus(self.device_number, self._sc_bool_ref)
         self._check("GetUSBStatus", _ret)
-        return _have_error.value
+        return self._sc_bool.value
 
     @property
     def active_channel(self) -> int:
         """
         Get the current active channel.
 
+        The channel is mirrored in Python after the first query or set, so
+        repeated reads do not reach the DLL. Call `invalidate_channel_cache()`
+        if the channel may have been changed outside this object.
+
         Returns
         -------
         int
             Index of the currently active optical input channel.
         """
-        _ch = ctypes.c_int()
-        _ret = self._dll.GetActiveChannel(ctypes.byref(_ch))
+        if self._active_channel_cache is not None:
+            return self._active_channel_cache
+        _ret = self._GetActiveChannel(self._sc_int1_ref)
         self._check("GetActiveChannel", _ret)
-        logger.debug(f"Active channel: {_ch.value}")
-        return _ch.value
+        ch = self._sc_int1.value
+        self._active_channel_cache = ch
+        if self.verbose:
+            logger.debug("Active channel: %d", ch)
+        return ch
 
     @active_channel.setter
     def active_channel(self, ch: int) -> None:
@@ -507,10 +657,24 @@ class OPM150(Instrument):
         ----------
         ch : int
             Channel number (1–24). Channels are 1-based, not zero-indexed.
+            Setting the channel that is already active is a no-op.
+        """
+        if ch == self._active_channel_cache:
+            return
+        _ret = self._SetActiveChannel(ch)
+        if _ret != 0 and _ret != 1:
+            self._check("SetActiveChannel", _ret)
+        self._active_channel_cache = ch
+        if self.verbose:
+            logger.debug("Active channel set to %d.", ch)
+
+    def invalidate_channel_cache(self) -> None:
+        """
+        Forget the mirrored active channel.
+
+        The next read of `active_channel` queries the DLL again.
         """
-        _ret = self._dll.SetActiveChannel(ctypes.c_int(ch))
-        self._check("SetActiveChannel", _ret)
-        logger.debug(f"Active channel set to {ch}.")
+        self._active_channel_cache = None
 
     def temperature(self, unit: Literal[0, 1, 2] = 1) -> float:
         """
@@ -529,11 +693,11 @@ class OPM150(Instrument):
         float
             Temperature in the specified unit.
         """
-        temperature = ctypes.c_double()
-        _ret = self._dll.GetTemperature(ctypes.byref(temperature), unit)
+        _ret = self._dll.GetTemperature(self._sc_temp_ref, unit)
         self._check("GetTemperature", _ret)
-        logger.debug(f"Temperature: {temperature.value:.2f} (unit={unit}).")
-        return temperature.value
+        temperature = self._sc_temp.value
+        logger.debug("Temperature: %.2f (unit=%d).", temperature, unit)
+        return temperature
 
     @property
     def wavelength(self) -> Wavelengths:
@@ -545,15 +709,13 @@ class OPM150(Instrument):
         Wavelengths
             Enum value representing the active wavelength.
         """
-        wl = ctypes.c_int()
-        idx = ctypes.c_int()
-        ct = ctypes.c_int()
         _ret = self._dll.GetWavelength(
-            ctypes.byref(wl), ctypes.byref(idx), ctypes.byref(ct)
+            self._sc_int1_ref, self._sc_int2_ref, self._sc_int3_ref
         )
         self._check("GetWavelength", _ret)
-        logger.debug(f"Wavelength: {wl.value} nm (index={idx.value}).")
-        return Wavelengths(wl.value)
+        wl = self._sc_int1.value
+        logger.debug("Wavelength: %d nm (index=%d).", wl, self._sc_int2.value)
+        return Wavelengths(wl)
 
     @wavelength.setter
     def wavelength(self, wavelength: int) -> None:
@@ -577,10 +739,9 @@ class OPM150(Instrument):
                 f"Wavelength {wavelength} not supported. "
                 f"Available values: {[w.value for w in self.available_wavelengths]}"
             )
-        _wavelength = ctypes.c_int(wl.value)
-        _ret = self._dll.SetWavelength(_wavelength)
+        _ret = self._dll.SetWavelength(wl.value)
         self._check("SetWavelength", _ret)
-        logger.debug(f"Wavelength set to {wl.value} nm")
+        logger.debug("Wavelength set to %d nm", wl.value)
 
     def read_adc(self) -> int:
         """
@@ -591,17 +752,20 @@ class OPM150(Instrument):
         int
             Raw analog value.
         """
-        _analog = ctypes.c_int()
-        _gain = ctypes.c_int()
-        _mode = ctypes.c_int()
-        _ret = self._dll.ReadAnalog(
-            ctypes.byref(_analog), ctypes.byref(_gain), ctypes.byref(_mode)
-        )
-        self._check("ReadAnalog", _ret)
-        logger.debug(
-            f"Analog: {_analog.value}, gain={_gain.value}, mode={_mode.value}"
+        _ret = self._ReadAnalog(
+            self._sc_int1_ref, self._sc_int2_ref, self._sc_int3_ref
         )
-        return _analog.value
+        if _ret != 0 and _ret != 1:
+            self._check("ReadAnalog", _ret)
+        analog = self._sc_int1.value
+        if self.verbose:
+            logger.debug(
+                "Analog: %d, gain=%d, mode=%d",
+                analog,
+                self._sc_int2.value,
+                self._sc_int3.value,
+            )
+        return analog
 
     def adc_to_power(self, analog: int, gain: int) -> float:
         """
@@ -619,12 +783,10 @@ class OPM150(Instrument):
         float
             Power in dBm or W depending on self.power_unit.
         """
-        power = ctypes.c_double()
-        ret = self._dll.ConvertPower(
-            ctypes.c_int(analog), ctypes.c_int(gain), ctypes.byref(power)
-        )
-        self._check("ConvertPower", ret)
-        return self._to_power_unit(power.value, dbm=True)
+        ret = self._ConvertPower(analog, gain, self._sc_power_ref)
+        if ret != 0 and ret != 1:
+            self._check("ConvertPower", ret)
+        return self._to_power_unit(self._sc_power.value, dbm=True)
 
     def refresh_channels_buffers(self) -> None:
         """
@@ -638,7 +800,7 @@ class OPM150(Instrument):
         _ret = ERROR_CODE
     
         for t in range(max_iter):
-            _ret = self._dll.GetChannelBuffer()
+            _ret = self._GetChannelBuffer()
     
             if _ret != ERROR_CODE:
                 break
@@ -663,15 +825,33 @@ class OPM150(Instrument):
         float
             Power in dBm or W depending on self.power_unit.
         """
-        power = ctypes.c_double()
-        ret = self._dll.ReadChannelBuffer(ctypes.c_int(ch), ctypes.byref(power))
-        self._check("ReadChannelBuffer", ret)
-        logger.debug(f"Ch{ch}: {power.value:.3f} raw units")
-        return self._to_power_unit(power.value, dbm=True)
+        return self._to_power_unit(self._read_dbm_raw(ch), dbm=True)
+
+    def _read_dbm_raw(self, ch: int) -> float:
+        """
+        Read the buffered power of a channel in dBm, without unit conversion.
+
+        Parameters
+        ----------
+        ch : int
+            Channel number (1–24).
+
+        Returns
+        -------
+        float
+            Power in dBm as returned by the DLL.
+        """
+        ret = self._ReadChannelBuffer(ch, self._sc_power_ref)
+        if ret != 0 and ret != 1:
+            self._check("ReadChannelBuffer", ret)
+        power = self._sc_power.value
+        if self.verbose:
+            logger.debug("Ch%d: %.3f raw units", ch, power)
+        return power
 
     def read_power(
         self,
-        channels: int or list[int] = [i + 1 for i in range(24)],
+        channels: Optional[int | Sequence[int]] = None,
         sleep: float = 0.1,
     ) -> list[float]:
         """
@@ -679,24 +859,116 @@ class OPM150(Instrument):
 
         Parameters
         ----------
-        channels : int, list[int], default=[1..24]
-            List of channels to read (1-based).
+        channels : int, Sequence[int], optional
+            Channels to read (1-based). Defaults to all 24 channels.
         sleep : float, default=0.1
-            Delay (s) between reads, required by hardware timing.
+            Settling time (s) between the buffer refresh and the reads,
+            required by hardware timing.
 
         Returns
         -------
         list[float]
             Power readings for all requested channels, in dBm or W.
         """
+        return self.read_power_array(channels, sleep).tolist()
+
+    def read_power_array(
+        self,
+        channels: Optional[int | Sequence[int]] = None,
+        sleep: float = 0.1,
+    ) -> np.ndarray:
+        """
+        Read power from a list of channels as a NumPy array.
+
+        Same as `read_power()`, without boxing each reading into a Python
+        float.
+
+        Parameters
+        ----------
+        channels : int, Sequence[int], optional
+            Channels to read (1-based). Defaults to all 24 channels.
+        sleep : float, default=0.1
+            Settling time (s) between the buffer refresh and the reads,
+            required by hardware timing.
+
+        Returns
+        -------
+        np.ndarray
+            Power readings for all requested channels, in dBm or W.
+        """
+        self.start_channel_sweep(sleep)
+        return self.finish_channel_sweep(channels)
+
+    def start_channel_sweep(self, sleep: float = 0.1) -> None:
+        """
+        Refresh the channel buffers and return without waiting.
+
+        The settling time is tracked internally, so callers running back-to-back
+        sweeps can do their own processing before `finish_channel_sweep()`.
+
+        Parameters
+        ----------
+        sleep : float, default=0.1
+            Settling time (s) required by the hardware before the buffers
+            can be read.
+        """
         self.refresh_channels_buffers()
-        time.sleep(sleep)
+        self._sweep_ready_at = time.monotonic() + sleep
+
+    def finish_channel_sweep(
+        self, channels: Optional[int | Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Read the buffers refreshed by `start_channel_sweep()`.
+
+        Only the part of the settling time that has not yet elapsed is waited.
 
-        if isinstance(channels, int):
-            channels = [channels]
+        Parameters
+        ----------
+        channels : int, Sequence[int], optional
+            Channels to read (1-based). Defaults to all 24 channels.
+
+        Returns
+        -------
+        np.ndarray
+            Power readings for all requested channels, in dBm or W.
+
+        Raises
+        ------
+        RuntimeError
+            If no sweep has been started.
+        """
+        if self._sweep_ready_at is None:
+            raise RuntimeError("start_channel_sweep() must be called first.")
+        deadline, self._sweep_ready_at = self._sweep_ready_at, None
+
+        # Prepare the request while the hardware settles.
+        if channels is None:
+            channels = _ALL_CHANNELS
+        elif isinstance(channels, int):
+            channels = (channels,)
+
+        # Raw dBm values are collected in a flat double buffer and converted
+        # in a single vectorized step.
+        n = len(channels)
+        if n <= len(self._sc_powers):
+            buf, out = self._sc_powers, self._sc_powers_view[:n]
+        else:
+            buf = (ctypes.c_double * n)()
+            out = np.frombuffer(buf, dtype=np.float64)
 
-        powers = [self.buffered_power(ch) for ch in channels]
-        logger.debug(f"Read {len(channels)} channels: {channels}")
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        ch, ret = self._read_channel_buffers(channels, buf)
+        if ret != 0:
+            self._check(f"ReadChannelBuffer(ch={ch})", ret)
+        # Copy, since dBm readings are still a view on the scratch buffer
+        powers = np.array(self._to_power_unit(out, dbm=True))
+
+        if self.verbose:
+            logger.debug("Read %d channels: %s", len(channels), channels)
         return powers
 
     def autorange(self, enabled: bool) -> None:
@@ -712,14 +984,14 @@ class OPM150(Instrument):
         -----
         Auto-Range setting is shared between adjacent channels.
         """
-        _range = ctypes.c_int(1) if enabled else ctypes.c_int(0)
-        _ret = self._dll.SetAutoRange(_range)
+        _ret = self._SetAutoRange(1 if enabled else 0)
         self._check("SetAutoRange", _ret)
-        logger.debug(
-            f"Autorange {'enabled' if enabled else 'disabled'} on active channel."
-        )
+        if self.verbose:
+            logger.debug(
+                "Autorange %s on active channel.", "enabled" if enabled else "disabled"
+            )
 
-    def autorange_all(self, enabled: bool) -> None:
+    def autorange_all(self, enabled: bool, delay: float = 0.05) -> None:
         """
         Apply Auto-Range setting to all channels.
 
@@ -727,20 +999,24 @@ class OPM150(Instrument):
         ----------
         enabled : bool
             True to enable Auto-Range, False to disable.
+        delay : float, default=0.05
+            Delay (s) after each channel switch. Pass 0 if the hardware does
+            not need settling between commands.
 
         Notes
         -----
-        Auto-Range applies to pairs of adjacent channels.
-        A small delay (0.05 s) is inserted between each channel update.
+        Auto-Range applies to pairs of adjacent channels, so only the first
+        channel of each pair is addressed.
         """
         _current = self.active_channel
-        for i in range(1, 25):
+        for i in _ODD_CHANNELS:
             self.active_channel = i
-            time.sleep(0.05)
+            if delay > 0:
+                time.sleep(delay)
             self.autorange(enabled)
         self.active_channel = _current
         logger.debug(
-            f"Autorange {'enabled' if enabled else 'disabled'} for all channels."
+            "Autorange %s for all channels.", "enabled" if enabled else "disabled"
         )
 
     @property
@@ -753,15 +1029,15 @@ class OPM150(Instrument):
         int
             Gain level (0–7).
         """
-        _analog = ctypes.c_int()
-        _gain = ctypes.c_int()
-        _mode = ctypes.c_int()
-        _ret = self._dll.ReadAnalog(
-            ctypes.byref(_analog), ctypes.byref(_gain), ctypes.byref(_mode)
+        _ret = self._ReadAnalog(
+            self._sc_int1_ref, self._sc_int2_ref, self._sc_int3_ref
         )
-        self._check("ReadAnalog", _ret)
-        logger.debug(f"Gain (ch={self.active_channel}): {_gain.value}")
-        return _gain.value
+        if _ret != 0 and _ret != 1:
+            self._check("ReadAnalog", _ret)
+        gain = self._sc_int2.value
+        if self.verbose:
+            logger.debug("Gain (ch=%d): %d", self.active_channel, gain)
+        return gain
 
     @gain.setter
     def gain(self, gain: Literal[0, 1, 2, 3, 4, 5, 6, 7]) -> None:
@@ -773,12 +1049,14 @@ class OPM150(Instrument):
         gain : int
             Gain level (0–7). Automatically disables Auto-Range.
         """
-        _gain = ctypes.c_int(gain)
-        _ret = self._dll.SetGain(_gain)
+        _ret = self._SetGain(gain)
         self._check("SetGain", _ret)
-        logger.debug(f"Gain set to {gain} (Auto-Range disabled)")
+        if self.verbose:
+            logger.debug("Gain set to %d (Auto-Range disabled)", gain)
 
-    def gain_all(self, gain: Literal[0, 1, 2, 3, 4, 5, 6, 7]) -> None:
+    def gain_all(
+        self, gain: Literal[0, 1, 2, 3, 4, 5, 6, 7], delay: float = 0.05
+    ) -> None:
         """
         Set the gain for all channels.
 
@@ -786,14 +1064,23 @@ class OPM150(Instrument):
         ----------
         gain : int
             Gain level (0–7). Automatically disables Auto-Range.
+        delay : float, default=0.05
+            Delay (s) after each channel switch. Pass 0 if the hardware does
+            not need settling between commands.
+
+        Notes
+        -----
+        Gain applies to pairs of adjacent channels, so only the first
+        channel of each pair is addressed.
         """
         _current = self.active_channel
-        for i in range(1, 25):
+        for i in _ODD_CHANNELS:
             self.active_channel = i
-            time.sleep(0.05)
+            if delay > 0:
+                time.sleep(delay)
             self.gain = gain
         self.active_channel = _current
-        logger.debug(f"Gain set to {gain} for all channels")
+        logger.debug("Gain set to %d for all channels", gain)
 
     @property
     def sampling_speed(self) -> Optional[int]:
@@ -818,42 +1105,48 @@ class OPM150(Instrument):
             Speed setting (0 = fastest, 8 = slowest).
         """
         self._sampling_speed = speed
-        _speed = ctypes.c_byte(speed)
-        _ret = self._dll.SetSamplingSpeed(_speed)
+        _ret = self._dll.SetSamplingSpeed(speed)
         self._check("SetSamplingSpeed", _ret)
-        logger.debug(f"Sampling speed set to {speed}")
+        logger.debug("Sampling speed set to %d", speed)
 
-    def _to_power_unit(self, value: float, dbm: bool = False) -> float:
+    def _to_power_unit(
+        self, value: float | np.ndarray, dbm: bool = False
+    ) -> float | np.ndarray:
         """
         Convert raw dBm to the correct unit and log the value.
 
         Parameters
         ----------
-        value_dbm : float
-            Power in dBm from the DLL.
+        value : float or np.ndarray
+            Power in dBm from the DLL, either a single reading or an array of
+            readings converted in one vectorized step.
 
         Returns
         -------
-        float
+        float or np.ndarray
             Power in dBm or W depending on self.power_unit.
         """
         if self.power_unit == 0:  # dBm
-            logger.debug(f"Power: {value:.3f} dBm")
+            if self.verbose:
+                logger.debug("Power: %s dBm", value)
             return value
         elif self.power_unit == 1:  # W
             pw = self._db_to_linear(value, dbm=dbm)
-            logger.debug(f"Power: {pw:.3e} W (converted)")
+            if self.verbose:
+                logger.debug("Power: %s W (converted)", pw)
             return pw
         else:
             raise ValueError("power_unit must be either 0 (dBm) or 1 (W).")
 
-    def _db_to_linear(self, value: float, dbm: bool = False) -> float:
+    def _db_to_linear(
+        self, value: float | np.ndarray, dbm: bool = False
+    ) -> float | np.ndarray:
         """
         Convert a power value from dB/dBm to linear units.
 
         Parameters
         ----------
-        value : float
+        value : float or np.ndarray
             Input value in dB (for relative power) or dBm (for absolute power).
         dbm : bool, default=False
             If True, input is in dBm and output is in Watts.
@@ -861,25 +1154,32 @@ class OPM150(Instrument):
 
         Returns
         -------
-        float
+        float or np.ndarray
             Linear value (Watts if dBm=True, ratio if dbm=False).
         """
-        factor = -3 if dbm else 0
-        return np.power(10, value / 10 + factor)
+        scale = 1e-3 if dbm else 1.0
+        if isinstance(value, np.ndarray):
+            return np.exp(value * _LN10_OVER_10) * scale
+        # math.exp avoids the ufunc dispatch overhead on single readings
+        return math.exp(value * _LN10_OVER_10) * scale
 
     def _check(self, func_name: str, err_code: int) -> None:
         """
         Internal error checker for DLL calls.
 
+        Hot readers compare the return code against the success codes inline
+        and only call this on failure.
+
         Raises
         ------
         Exception
-            If error code is not OK_0 or OK_1.
+            If error code is not OK_0 or OK_1 and `checked` is enabled.
         """
+        if err_code == 0 or err_code == 1 or not self.checked:
+            return
         code = ErrorCodes(err_code)
-        if code not in (ErrorCodes.OK_0, ErrorCodes.OK_1):
-            logger.error(f"{func_name} failed: {code.name}")
-            raise Exception(f"{func_name} failed: {code.name}")
+        logger.error(f"{func_name} failed: {code.name}")
+        raise Exception(f"{func_name} failed: {code.name}")
 
 
 if __name__ == "__main__":
@@ -12,7 +12,17 @@ The `AFG3011C` class allows for standard waveform configuration and control
 in photonic and electronic testing setups.
 """
 
+import time
+from contextlib import contextmanager
+from typing import Iterator
+from typing import Optional
+
 import pyvisa
+from fastruments import logger
+from fastruments.helpers import enable_srq
+from fastruments.helpers import get_rm
+from fastruments.helpers import shutdown_rm
+from fastruments.helpers import wait_for_opc
 from Instrument import Instrument
 
 
@@ -32,14 +42,20 @@ class AFG3011C(Instrument):
     timeout : int, optional
         Communication timeout in milliseconds (default: ``5000``).
     verbose : bool, optional
-        If ``True``, prints informational messages (default: ``True``).
+        If ``True``, logs informational messages (default: ``True``).
+    chunk_size : int, optional
+        VISA read chunk size in bytes (default: ``1048576``).
+    read_termination : str, optional
+        Read termination character (default: ``"\\n"``).
+    write_termination : str, optional
+        Write termination character (default: ``"\\n"``).
 
     Attributes
     ----------
     inst : pyvisa.Resource
         Active VISA session object.
     verbose : bool
-        Flag controlling console output.
+        Flag controlling informational log output.
     model : str
         Model name retrieved from the identification query.
 
@@ -59,6 +75,11 @@ class AFG3011C(Instrument):
     [AFG3011C] Output ON.
     >>> afg.close()
     [AFG3011C] Connection closed.
+
+    Notes
+    -----
+    For instrument-parallel automation, wrap the driver in
+    `helpers.AsyncInstrument` to await its methods from asyncio code.
     """
 
     __FREQ_RANGE = {
@@ -74,12 +95,52 @@ class AFG3011C(Instrument):
 
     __AMPL_MIN = {"50": 20e-3, "INF": 40e-3}  # Vpp
 
-    __IMPEDANCE_MODES = {"50", "INF"}
+    __IMPEDANCE_MODES = frozenset({"50", "INF"})
+    __IMPEDANCE_MODES_SORTED = tuple(sorted(__IMPEDANCE_MODES))
+
+    __FUNCTIONS = frozenset({"SIN", "SQU", "RAMP", "PULS", "PRN", "DC"})
+    __FUNCTIONS_SORTED = tuple(sorted(__FUNCTIONS))
+
+    # Accepted spellings -> canonical name, so the common cases skip .upper()
+    __FUNC_NORMALIZE = {
+        **{f.lower(): f for f in __FUNCTIONS},
+        **{f: f for f in __FUNCTIONS},
+    }
+    __IMP_NORMALIZE = {
+        **{m.lower(): m for m in __IMPEDANCE_MODES},
+        **{m: m for m in __IMPEDANCE_MODES},
+    }
+
+    # OUTP1:IMP? reply -> canonical mode; "99.0e36" is how Tektronix reports High-Z
+    __IMP_DECODE = {"99.0e36": "INF", "50e0": "50", "INF": "INF", "50": "50"}
+
+    # SCPI command prefixes, completed with the value at call time
+    __CMD_FUNC = "SOUR1:FUNC "
+    __CMD_FREQ = "SOUR1:FREQ "
+    __CMD_VOLT = "SOUR1:VOLT "
+    __CMD_OFFS = "SOUR1:VOLT:OFFS "
+    __CMD_IMP = "OUTP1:IMP "
+    __CMD_STAT = "OUTP1:STAT "
+
+    __STATE_QUERIES = {
+        "func": "SOUR1:FUNC?",
+        "imp": "OUTP1:IMP?",
+        "ampl": "SOUR1:VOLT?",
+        "offs": "SOUR1:VOLT:OFFS?",
+    }  # cache key -> SCPI query
 
-    __FUNCTIONS = {"SIN", "SQU", "RAMP", "PULS", "PRN", "DC"}
+    __ESR_ERRORS = 0x3C  # *ESR? query, device, execution and command error bits
+
+    __CONNECT_ATTEMPTS = 3  # open_resource tries before giving up
 
     def __init__(
-        self, resource: str, timeout: int = 5000, verbose: bool = True
+        self,
+        resource: str,
+        timeout: int = 5000,
+        verbose: bool = True,
+        chunk_size: int = 1_048_576,
+        read_termination: str = "\n",
+        write_termination: str = "\n",
     ) -> None:
         """
         Initialize communication with the Tektronix AFG3011C instrument.
@@ -89,6 +150,11 @@ class AFG3011C(Instrument):
         self.verbose = verbose
         self.timeout = timeout
         self.resource = resource
+        self.chunk_size = chunk_size
+        self.read_termination = read_termination
+        self.write_termination = write_termination
+        self._cache = {}  # last known instrument state, written by the setters
+        self._srq_armed = False  # SRQ queued for the pending *OPC, see enable_srq
         self.connect()
 
     # ------------------------------------------------------------------
@@ -98,9 +164,13 @@ class AFG3011C(Instrument):
         """
         Establish the VISA connection with the function generator.
 
-        This method initializes the VISA Resource Manager, opens the USB
-        resource, and sets the communication timeout. It also performs an
-        initial identification query to verify the connection.
+        This method opens the USB resource through the process-wide VISA
+        Resource Manager (created on first use), and sets the communication
+        timeout, chunk size and termination characters. It also performs an initial identification
+        query to verify the connection.
+
+        Transient VISA I/O errors while opening the resource (e.g. during USB
+        enumeration) are retried up to three times with exponential backoff.
 
         Raises
         ------
@@ -110,9 +180,26 @@ class AFG3011C(Instrument):
             If the instrument fails to respond to the identification query.
         """
         try:
-            rm = pyvisa.ResourceManager()
-            self.inst = rm.open_resource(self.resource)
+            for attempt in range(self.__CONNECT_ATTEMPTS):
+                try:
+                    self.inst = get_rm().open_resource(self.resource)
+                    break
+                except pyvisa.errors.VisaIOError as e:
+                    if attempt == self.__CONNECT_ATTEMPTS - 1:
+                        raise
+                    delay = 0.1 * 2**attempt
+                    logger.warning(
+                        "Opening %s failed (%s), retrying in %.1f s.",
+                        self.resource,
+                        e,
+                        delay,
+                    )
+                    time.sleep(delay)
             self.inst.timeout = self.timeout
+            self.inst.chunk_size = self.chunk_size
+            self.inst.read_termination = self.read_termination
+            self.inst.write_termination = self.write_termination
+            self.inst.send_end = True
         except Exception as e:
             raise ConnectionError(
                 f"[AFG3011C][ERROR] Could not connect to function generator: {e}"
@@ -120,7 +207,7 @@ class AFG3011C(Instrument):
         try:
             self.idn()
             if self.verbose:
-                print("[AFG3011C] Connected successfully.")
+                logger.info("Connected successfully.")
         except Exception as e:
             raise RuntimeError(f"[AFG3011C][ERROR] Failed to query IDN: {e}")
 
@@ -135,7 +222,7 @@ class AFG3011C(Instrument):
         """
         idn = self.inst.query("*IDN?").strip()
         if self.verbose:
-            print(f"[AFG3011C] IDN: {idn}.")
+            logger.info("IDN: %s.", idn)
         return idn
 
     def reset(self) -> None:
@@ -143,16 +230,57 @@ class AFG3011C(Instrument):
         Reset the instrument to factory defaults.
         """
         self.inst.write("*RST")
+        self.invalidate_cache()
         if self.verbose:
-            print("[AFG3011C] Instrument reset to defaults.")
+            logger.info("Instrument reset to defaults.")
 
     def clear(self) -> None:
         """
         Clear the status and event registers.
         """
         self.inst.write("*CLS")
+        self.invalidate_cache()
         if self.verbose:
-            print("[AFG3011C] Status registers cleared.")
+            logger.info("Status registers cleared.")
+
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached instrument state.
+
+        The next getter call queries the instrument again. Call this if the
+        instrument may have been changed from its front panel.
+        """
+        self._cache.clear()
+
+    def refresh_state(self) -> None:
+        """
+        Re-read the cached instrument state with a single compound query.
+
+        Use this if the state may have drifted from what the host last wrote.
+        """
+        self.invalidate_cache()
+        self._cached_state(*self.__STATE_QUERIES)
+
+    @contextmanager
+    def quiet(self) -> Iterator[None]:
+        """
+        Temporarily disable verbose logging.
+
+        Useful in sweep loops, where per-call status messages only add
+        overhead. The previous ``verbose`` setting is restored on exit.
+
+        Examples
+        --------
+        >>> with afg.quiet():
+        ...     for f in freqs:
+        ...         afg.set_frequency(f)
+        """
+        prev = self.verbose
+        self.verbose = False
+        try:
+            yield
+        finally:
+            self.verbose = prev
 
     def beep(self) -> None:
         """
@@ -160,7 +288,7 @@ class AFG3011C(Instrument):
         """
         self.inst.write("SYST:BEEP")
         if self.verbose:
-            print("[AFG3011C] Beep command sent.")
+            logger.info("Beep command sent.")
 
     def close(self) -> None:
         """
@@ -169,6 +297,8 @@ class AFG3011C(Instrument):
         Notes
         -----
         Should always be called before program termination to release the USB resource.
+        Only the instrument session is closed; the shared Resource Manager stays
+        open for other instances until :meth:`shutdown_rm` is called.
 
         Raises
         ------
@@ -178,10 +308,101 @@ class AFG3011C(Instrument):
         try:
             self.inst.close()
             if self.verbose:
-                print("[AFG3011C] Connection closed.")
+                logger.info("Connection closed.")
         except Exception as e:
             raise RuntimeError(f"[AFG3011C][ERROR] Failed to close connection: {e}")
 
+    @classmethod
+    def shutdown_rm(cls) -> None:
+        """
+        Close the process-wide VISA Resource Manager.
+
+        The manager is shared by all VISA drivers of the package (see
+        `fastruments.helpers.get_rm`), so any instrument still connected
+        through it, of any type, becomes unusable. The next
+        call to :meth:`connect` creates a fresh Resource Manager.
+        """
+        shutdown_rm()
+
+    def _write_batch(self, *cmds: str) -> None:
+        """
+        Send several SCPI commands as a single compound message.
+
+        Parameters
+        ----------
+        *cmds : str
+            Complete SCPI commands, joined into one VISA write. Subsystem
+            commands get a leading ``:`` so each is parsed from the root
+            rather than from the previous command's subtree; common
+            commands (``*...``) are sent as they are.
+        """
+        self.inst.write(";".join(c if c[0] == "*" else ":" + c for c in cmds))
+
+    @staticmethod
+    def _within_limits(ampl: float, offset: float, vlimit: float) -> bool:
+        """
+        Check ``|offset ± ampl/2| <= vlimit`` for a non-negative amplitude.
+        """
+        return abs(offset) + ampl * 0.5 <= vlimit
+
+    @staticmethod
+    def _normalize(table: dict, value: str) -> Optional[str]:
+        """
+        Map a user or instrument spelling to its canonical name.
+
+        Returns ``None`` if `value` is not a known name in any letter case.
+        """
+        canonical = table.get(value)
+        if canonical is None:
+            canonical = table.get(value.upper())
+        return canonical
+
+    def _multi_query(self, *queries: str) -> list[str]:
+        """
+        Send several SCPI queries as a single compound message.
+
+        Parameters
+        ----------
+        *queries : str
+            Complete SCPI queries, joined with ``;:`` into one VISA query.
+
+        Returns
+        -------
+        list[str]
+            One response per query, in the same order.
+        """
+        return self.inst.query(";:".join(queries)).strip().split(";")
+
+    def _cached_state(self, *keys: str) -> list:
+        """
+        Return instrument state values, querying only those not cached.
+
+        All missing values are fetched with a single compound query.
+
+        Parameters
+        ----------
+        *keys : str
+            State keys as in `__STATE_QUERIES`.
+
+        Returns
+        -------
+        list
+            Values in the same order as `keys`.
+        """
+        missing = [k for k in keys if k not in self._cache]
+        if missing:
+            answers = self._multi_query(*(self.__STATE_QUERIES[k] for k in missing))
+            for key, raw in zip(missing, answers):
+                raw = raw.strip()
+                if key == "imp":
+                    self._cache[key] = self.__IMP_DECODE.get(raw, raw)
+                elif key == "func":
+                    func = self._normalize(self.__FUNC_NORMALIZE, raw)
+                    self._cache[key] = raw if func is None else func
+                else:
+                    self._cache[key] = float(raw)
+        return [self._cache[k] for k in keys]
+
     # ------------------------------------------------------------------
     # Basic waveform control
     # ------------------------------------------------------------------
@@ -199,15 +420,17 @@ class AFG3011C(Instrument):
         ValueError
             If the waveform type is not valid.
         """
-        func = func.upper()
-        if func not in self.__FUNCTIONS:
+        canonical = self._normalize(self.__FUNC_NORMALIZE, func)
+        if canonical is None:
             raise ValueError(
                 f"[AFG3011C][ERROR] Invalid function '{func}'. "
-                f"Valid options: {sorted(self.__FUNCTIONS)}."
+                f"Valid options: {self.__FUNCTIONS_SORTED}."
             )
-        self.inst.write(f"SOUR1:FUNC {func}")
+        func = canonical
+        self.inst.write(self.__CMD_FUNC + func)
+        self._cache["func"] = func
         if self.verbose:
-            print(f"[AFG3011C] Function set to {func}.")
+            logger.info("Function set to %s.", func)
 
     def get_function(self) -> str:
         """
@@ -218,9 +441,9 @@ class AFG3011C(Instrument):
         str
             Current waveform type as in `__FUNCTIONS`.
         """
-        func = self.inst.query("SOUR1:FUNC?").strip()
+        (func,) = self._cached_state("func")
         if self.verbose:
-            print(f"[AFG3011C] Current function: {func}.")
+            logger.info("Current function: %s.", func)
         return func
 
     def set_frequency(self, freq: float) -> None:
@@ -239,7 +462,7 @@ class AFG3011C(Instrument):
             If DC function is set.
             If the frequency is outside the allowed range.
         """
-        func = self.get_function().upper()
+        (func,) = self._cached_state("func")
         if func == "DC":  # Frequency makes no sense for DC
             raise ValueError(
                 "[AFG3011C][ERROR] DC mode does not support frequency setting."
@@ -250,9 +473,9 @@ class AFG3011C(Instrument):
                 f"[AFG3011C][ERROR] Frequency {freq} Hz out of range for {func}: "
                 f"{fmin}–{fmax} Hz."
             )
-        self.inst.write(f"SOUR1:FREQ {freq}")
+        self.inst.write(self.__CMD_FREQ + str(freq))
         if self.verbose:
-            print(f"[AFG3011C] Frequency set to {freq} Hz.")
+            logger.info("Frequency set to %s Hz.", freq)
 
     def get_frequency(self) -> float:
         """
@@ -265,7 +488,7 @@ class AFG3011C(Instrument):
         """
         val = float(self.inst.query("SOUR1:FREQ?"))
         if self.verbose:
-            print(f"[AFG3011C] Frequency = {val} Hz.")
+            logger.info("Frequency = %s Hz.", val)
         return val
 
     def set_amplitude(self, ampl: float) -> None:
@@ -297,24 +520,23 @@ class AFG3011C(Instrument):
             If amplitude exceeds lower hardware limits.
             If amplitude exceeds higher hardware limits.
         """
-        impedance = self.get_output_impedance().upper()
+        impedance, offset = self._cached_state("imp", "offs")
         amin = self.__AMPL_MIN[impedance]
         if not (amin <= ampl):  # Check min value
             raise ValueError(
                 f"[AFG3011C][ERROR] Amplitude {ampl} Vpp lower than "
                 f"{amin} Vpp for {impedance} Ω."
             )
-        vpk = ampl / 2.0
-        offset = self.get_offset()
         vlimit = self.__V_LIMIT[impedance]
-        if (offset + vpk) > vlimit or (offset - vpk) < -vlimit:  # Check combined range
+        if not self._within_limits(ampl, offset, vlimit):  # Check combined range
             raise ValueError(
                 f"[AFG3011C][ERROR] Amplitude {ampl} Vpp with offset {offset} V "
                 f"exceeds output voltage limits ±{vlimit} V for {impedance} Ω."
             )
-        self.inst.write(f"SOUR1:VOLT {ampl}")
+        self.inst.write(self.__CMD_VOLT + str(ampl))
+        self._cache["ampl"] = ampl
         if self.verbose:
-            print(f"[AFG3011C] Amplitude set to {ampl} Vpp.")
+            logger.info("Amplitude set to %s Vpp.", ampl)
 
     def get_amplitude(self) -> float:
         """
@@ -325,9 +547,9 @@ class AFG3011C(Instrument):
         float
             Amplitude in volts peak-to-peak.
         """
-        val = float(self.inst.query("SOUR1:VOLT?"))
+        (val,) = self._cached_state("ampl")
         if self.verbose:
-            print(f"[AFG3011C] Amplitude = {val} Vpp.")
+            logger.info("Amplitude = %s Vpp.", val)
         return val
 
     def set_offset(self, offset: float) -> None:
@@ -356,18 +578,17 @@ class AFG3011C(Instrument):
         ValueError
             If offset exceeds hardware limits.
         """
-        impedance = self.get_output_impedance().upper()
-        ampl = self.get_amplitude()
-        vpk = ampl / 2.0
+        impedance, ampl = self._cached_state("imp", "ampl")
         vlimit = self.__V_LIMIT[impedance]
-        if (offset + vpk) > vlimit or (offset - vpk) < -vlimit:  # Check combined range
+        if not self._within_limits(ampl, offset, vlimit):  # Check combined range
             raise ValueError(
                 f"[AFG3011C][ERROR] Offset {offset} V with amplitude {ampl} Vpp "
                 f"exceeds output voltage limits ±{vlimit} V for {impedance} Ω."
             )
-        self.inst.write(f"SOUR1:VOLT:OFFS {offset}")
+        self.inst.write(self.__CMD_OFFS + str(offset))
+        self._cache["offs"] = offset
         if self.verbose:
-            print(f"[AFG3011C] Offset set to {offset} V.")
+            logger.info("Offset set to %s V.", offset)
 
     def get_offset(self) -> float:
         """
@@ -378,9 +599,9 @@ class AFG3011C(Instrument):
         float
             Offset voltage in volts.
         """
-        val = float(self.inst.query("SOUR1:VOLT:OFFS?"))
+        (val,) = self._cached_state("offs")
         if self.verbose:
-            print(f"[AFG3011C] Offset = {val} V.")
+            logger.info("Offset = %s V.", val)
         return val
 
     # ------------------------------------------------------------------
@@ -400,15 +621,20 @@ class AFG3011C(Instrument):
         ValueError
             If an invalid impedance mode is provided.
         """
-        mode = mode.upper()
-        if mode not in self.__IMPEDANCE_MODES:
+        canonical = self._normalize(self.__IMP_NORMALIZE, mode)
+        if canonical is None:
             raise ValueError(
                 f"[AFG3011C][ERROR] Invalid impedance mode '{mode}'. "
-                f"Valid options: {sorted(self.__IMPEDANCE_MODES)}."
+                f"Valid options: {self.__IMPEDANCE_MODES_SORTED}."
             )
-        self.inst.write(f"OUTP1:IMP {mode}")
+        mode = canonical
+        self.inst.write(self.__CMD_IMP + mode)
+        # Amplitude and offset are expressed into the load, so they change too
+        self._cache.pop("ampl", None)
+        self._cache.pop("offs", None)
+        self._cache["imp"] = mode
         if self.verbose:
-            print(f"[AFG3011C] Output impedance set to {mode} Ω.")
+            logger.info("Output impedance set to %s Ω.", mode)
 
     def get_output_impedance(self) -> str:
         """
@@ -419,19 +645,15 @@ class AFG3011C(Instrument):
         str
             Impedance mode as in `__IMPEDANCE_MODES`.
         """
-        val = self.inst.query("OUTP1:IMP?").strip()
-        if val == "99.0e36":  # Tektronix uses "99.0e36" to indicate High-Z
-            val = "INF"
-        elif val == "50e0":
-            val = "50"
+        (val,) = self._cached_state("imp")
         if self.verbose:
-            print(f"[AFG3011C] Current output impedance: {val} Ω.")
+            logger.info("Current output impedance: %s Ω.", val)
         return val
 
     # ------------------------------------------------------------------
     # Output control
     # ------------------------------------------------------------------
-    def set_output_state(self, state: bool) -> None:
+    def set_output_state(self, state: bool, wait: bool = True) -> None:
         """
         Set the output channel state.
 
@@ -441,17 +663,55 @@ class AFG3011C(Instrument):
         experiment since the use of *OPC? guarantees that the instrument is in
         the required state.
 
+        With ``wait=False`` the command is sent together with *OPC and the
+        method returns immediately; the Operation Complete event raises a
+        service request, and `wait_for_operation()` can be used as the fence
+        when needed.
+
         Parameters
         ----------
         state : bool
             ``True`` to enable the output, ``False`` to disable it.
+        wait : bool, optional
+            If ``True`` (default), block on *OPC? until the output is set.
 
         """
         cmd = "ON" if state else "OFF"
-        self.inst.write(f"OUTP1:STAT {cmd}")
-        self.inst.query("*OPC?")
+        if wait:
+            self.inst.write(self.__CMD_STAT + cmd)
+            self.inst.query("*OPC?")
+        else:
+            # Queue the SRQ before *OPC is sent, so that a fast operation
+            # cannot complete before anyone listens for it
+            self._srq_armed = enable_srq(self.inst)
+            # *CLS drops an OPC left by an earlier, unawaited operation;
+            # OPC -> ESB (ESE bit 0), ESB -> SRQ (SRE bit 5)
+            self._write_batch(
+                "*CLS", "*ESE 1", "*SRE 32", self.__CMD_STAT + cmd, "*OPC"
+            )
         if self.verbose:
-            print(f"[AFG3011C] Output set to {cmd}.")
+            logger.info("Output set to %s.", cmd)
+
+    def wait_for_operation(self, timeout: float = 5.0) -> None:
+        """
+        Wait for the Operation Complete event of a pending *OPC.
+
+        Returns at once if the operation has already completed; otherwise
+        waits on the service request armed by ``set_output_state(wait=False)``
+        when the VISA session supports it, polling *ESR? if not.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum waiting time in seconds (default: ``5.0``).
+
+        Raises
+        ------
+        TimeoutError
+            If the operation does not complete within `timeout`.
+        """
+        wait_for_opc(self.inst, timeout, "AFG3011C", srq=self._srq_armed)
+        self._srq_armed = False
 
     def get_output_state(self) -> bool:
         """
@@ -462,10 +722,116 @@ class AFG3011C(Instrument):
         bool
             ``True`` if output is enabled, ``False`` otherwise.
         """
-        state = self.inst.query("OUTP1:STAT?").strip()
+        # pyvisa already strips the read termination; the first char decides.
+        state = self.inst.query("OUTP1:STAT?")[:1] == "1"
+        if self.verbose:
+            logger.info("Output state: %s.", "ON" if state else "OFF")
+        return state
+
+    # ------------------------------------------------------------------
+    # Batch configuration
+    # ------------------------------------------------------------------
+    def set_waveform(
+        self,
+        func: str,
+        freq: float,
+        ampl: float,
+        offset: float = 0.0,
+        impedance: Optional[str] = None,
+        state: Optional[bool] = None,
+    ) -> None:
+        """
+        Configure the whole output waveform in a single SCPI transaction.
+
+        All parameters are validated locally with the same rules as the
+        individual setters, then sent as one compound message followed by a
+        single *OPC? fence.
+
+        Parameters
+        ----------
+        func : str
+            Waveform type. Valid options are defined in `__FUNCTIONS`.
+        freq : float
+            Frequency in hertz. Ignored for ``"DC"``.
+        ampl : float
+            Peak-to-peak amplitude in volts.
+        offset : float, optional
+            Offset voltage in volts (default: ``0.0``).
+        impedance : str, optional
+            Output impedance mode. If ``None``, the current mode is kept.
+        state : bool, optional
+            Output state to apply last. If ``None``, the output is not changed.
+
+        Raises
+        ------
+        ValueError
+            If any parameter is outside the limits enforced by the setters.
+        RuntimeError
+            If the instrument rejects part of the batch. The cached state is
+            discarded, since it is unknown which settings were applied.
+        """
+        canonical = self._normalize(self.__FUNC_NORMALIZE, func)
+        if canonical is None:
+            raise ValueError(
+                f"[AFG3011C][ERROR] Invalid function '{func}'. "
+                f"Valid options: {self.__FUNCTIONS_SORTED}."
+            )
+        func = canonical
+        if impedance is None:
+            (impedance,) = self._cached_state("imp")
+            cmds = []
+        else:
+            canonical = self._normalize(self.__IMP_NORMALIZE, impedance)
+            if canonical is None:
+                raise ValueError(
+                    f"[AFG3011C][ERROR] Invalid impedance mode '{impedance}'. "
+                    f"Valid options: {self.__IMPEDANCE_MODES_SORTED}."
+                )
+            impedance = canonical
+            cmds = [self.__CMD_IMP + impedance]
+        cmds.append(self.__CMD_FUNC + func)
+        if func != "DC":
+            fmin, fmax = self.__FREQ_RANGE[func]
+            if not (fmin <= freq <= fmax):
+                raise ValueError(
+                    f"[AFG3011C][ERROR] Frequency {freq} Hz out of range for {func}: "
+                    f"{fmin}–{fmax} Hz."
+                )
+            cmds.append(self.__CMD_FREQ + str(freq))
+        amin = self.__AMPL_MIN[impedance]
+        if not (amin <= ampl):
+            raise ValueError(
+                f"[AFG3011C][ERROR] Amplitude {ampl} Vpp lower than "
+                f"{amin} Vpp for {impedance} Ω."
+            )
+        vlimit = self.__V_LIMIT[impedance]
+        if not self._within_limits(ampl, offset, vlimit):
+            raise ValueError(
+                f"[AFG3011C][ERROR] Amplitude {ampl} Vpp with offset {offset} V "
+                f"exceeds output voltage limits ±{vlimit} V for {impedance} Ω."
+            )
+        # The instrument checks each command against the state left by the
+        # previous one. Zeroing the offset first lets the new amplitude in
+        # whatever the offset was, and the requested offset then fits with it
+        # under the new impedance (both checked above).
+        cmds += [self.__CMD_OFFS + "0", self.__CMD_VOLT + str(ampl)]
+        if offset != 0:
+            cmds.append(self.__CMD_OFFS + str(offset))
+        if state is not None:
+            cmds.append(self.__CMD_STAT + ("ON" if state else "OFF"))
+
+        # *CLS so that *ESR? reports only errors raised by this batch
+        self._write_batch("*CLS", *cmds)
+        _, esr = self.inst.query("*OPC?;*ESR?").strip().split(";")
+        if int(esr) & self.__ESR_ERRORS:
+            self.invalidate_cache()
+            raise RuntimeError(
+                "[AFG3011C][ERROR] Waveform settings rejected: "
+                f"{self.inst.query('SYST:ERR?').strip()}"
+            )
+        self._cache.update(func=func, imp=impedance, ampl=ampl, offs=offset)
         if self.verbose:
-            print(f"[AFG3011C] Output state: {'ON' if state == '1' else 'OFF'}.")
-        return state == "1"
+            logger.info("Waveform set to %s.", "; ".join(cmds))
 
 
 if __name__ == "__main__":
@@ -911,7 +911,7 @@ class DPO2024B:
         if self.verbose:
             print(f"[DPO2024B] Donwloading data points from CH{channel}...")
         raw_data = self.inst.query(":CURV?")  # Get raw data
-        raw = np.fromstring(raw_data, sep=",")
+        raw = np.loadtxt([raw_data], delimiter=",", ndmin=1)  # C-level CSV parser
         ymult = float(self.inst.query(":WFMO:YMULT?"))  # Get Y parameters
         yoff = float(self.inst.query(":WFMO:YOFF?"))
         yzero = float(self.inst.query(":WFMO:YZERO?"))
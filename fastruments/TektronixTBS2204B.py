@@ -14,8 +14,17 @@ Python control of oscilloscopes is required, e.g. in integrated photonics
 and optoelectronic experiments.
 """
 
+import re
+from typing import Optional
+from typing import Sequence
+
 import numpy as np
 import pyvisa
+from fastruments import logger
+from fastruments.helpers import enable_srq
+from fastruments.helpers import get_rm
+from fastruments.helpers import shutdown_rm
+from fastruments.helpers import wait_for_opc
 from Instrument import Instrument
 
 
@@ -36,16 +45,21 @@ class TBS2204B(Instrument):
     timeout : int, optional
         Communication timeout in milliseconds (default: ``20000``).
     verbose : bool, optional
-        If ``True``, prints diagnostic and status messages (default: ``True``).
+        If ``True``, logs diagnostic and status messages (default: ``True``).
+    chunk_size : int, optional
+        VISA read chunk size in bytes (default: ``2000000``). Large enough that a
+        full-length binary record arrives in a handful of reads.
 
     Attributes
     ----------
     inst : pyvisa.Resource
         Active VISA resource representing the instrument connection.
     verbose : bool
-        Verbosity flag controlling console output.
+        Verbosity flag controlling informational log output.
     timeout : int
         VISA communication timeout (milliseconds).
+    chunk_size : int
+        VISA read chunk size (bytes).
 
     Examples
     --------
@@ -61,83 +75,108 @@ class TBS2204B(Instrument):
     [TBS2204B] Single-sequence acquisition started.
     [TBS2204B] Single-sequence acquisition completed.
     >>> t, v = scope.get_waveform(1)
-    [TBS2204B] Donwloading data points from CH1...
+    [TBS2204B] Downloading data points from CH1...
     [TBS2204B] Acquired 2000 points from CH1.
     >>> scope.close()
     [TBS2204B] Connection closed.
+
+    Several scopes can be read concurrently through
+    :class:`fastruments.helpers.AsyncInstrument`, which runs each call in a
+    worker thread and serializes calls on the same instrument:
+
+    >>> a, b = AsyncInstrument(scope_a), AsyncInstrument(scope_b)
+    >>> (ta, va), (tb, vb) = await asyncio.gather(
+    ...     a.get_waveform(1), b.get_waveform(1)
+    ... )
     """
 
     __NUM_CHANNELS = 4
+    __VALID_CHANNELS = frozenset(range(1, __NUM_CHANNELS + 1))
+
+    __TIMEBASE_SCALES = frozenset(
+        {
+            2e-9,
+            5e-9,
+            10e-9,
+            20e-9,
+            50e-9,
+            100e-9,
+            200e-9,
+            500e-9,
+            1e-6,
+            2e-6,
+            5e-6,
+            10e-6,
+            20e-6,
+            50e-6,
+            100e-6,
+            200e-6,
+            500e-6,
+            1e-3,
+            2e-3,
+            5e-3,
+            10e-3,
+            20e-3,
+            50e-3,
+            0.1,
+            0.2,
+            0.5,
+            1,
+            2,
+            5,
+            10,
+            20,
+            50,
+            100,
+        }
+    )
+    # Integer picoseconds, so float rounding in the argument cannot cause a miss
+    __TIMEBASE_SCALES_PS = frozenset(round(t * 1e12) for t in __TIMEBASE_SCALES)
+    __TIMEBASE_SCALES_SORTED = tuple(sorted(__TIMEBASE_SCALES))
+
+    __COUPLING_MODES = frozenset({"AC", "DC", "GND"})
+    __COUPLING_MODES_SORTED = tuple(sorted(__COUPLING_MODES))
+
+    __TRIGGER_MODES = frozenset({"AUTO", "NORM"})
+    __TRIGGER_MODES_SORTED = tuple(sorted(__TRIGGER_MODES))
 
-    __TIMEBASE_SCALES = {
-        2e-9,
-        5e-9,
-        10e-9,
-        20e-9,
-        50e-9,
-        100e-9,
-        200e-9,
-        500e-9,
-        1e-6,
-        2e-6,
-        5e-6,
-        10e-6,
-        20e-6,
-        50e-6,
-        100e-6,
-        200e-6,
-        500e-6,
-        1e-3,
-        2e-3,
-        5e-3,
-        10e-3,
-        20e-3,
-        50e-3,
-        0.1,
-        0.2,
-        0.5,
-        1,
-        2,
-        5,
-        10,
-        20,
-        50,
-        100,
-    }
-
-    __COUPLING_MODES = {"AC", "DC", "GND"}
-
-    __TRIGGER_MODES = {"AUTO", "NORM"}
-
-    __TRIGGER_SLOPES = {"RISE", "FALL"}
-
-    __RECORD_LENGTHS = {1_000, 2_000, 20_000, 200_000, 2_000_000, 5_000_000}
-
-    __VERTICAL_GAINS = {
-        0.001,
-        0.002,
-        0.005,
-        0.01,
-        0.02,
-        0.05,
-        0.1,
-        0.2,
-        0.5,
-        1,
-        2,
-        5,
-        10,
-        20,
-        50,
-        100,
-        200,
-        500,
-        1000,
-    }
+    __TRIGGER_SLOPES = frozenset({"RISE", "FALL"})
+    __TRIGGER_SLOPES_SORTED = tuple(sorted(__TRIGGER_SLOPES))
+
+    __RECORD_LENGTHS = frozenset(
+        {1_000, 2_000, 20_000, 200_000, 2_000_000, 5_000_000}
+    )
+    __RECORD_LENGTHS_SORTED = tuple(sorted(__RECORD_LENGTHS))
+    __MAX_RECORD_LENGTH = __RECORD_LENGTHS_SORTED[-1]  # :DAT:STOP for a whole record
+
+    __VERTICAL_GAINS = frozenset(
+        {
+            0.001,
+            0.002,
+            0.005,
+            0.01,
+            0.02,
+            0.05,
+            0.1,
+            0.2,
+            0.5,
+            1,
+            2,
+            5,
+            10,
+            20,
+            50,
+            100,
+            200,
+            500,
+            1000,
+        }
+    )
+    __VERTICAL_GAINS_SORTED = tuple(sorted(__VERTICAL_GAINS))
 
     __VERTICAL_POSITION_RANGE = (-5.0, 5.0)
 
-    __VERTICAL_SCALES = (
+    __VERTICAL_SCALES = frozenset(
         {  # This is valid only for gain = 1, otherwise it scales accordingly.
             2e-3,
             5e-3,
@@ -152,11 +191,48 @@ class TBS2204B(Instrument):
             5.0,
         }
     )
+    # Integer microvolts, compared against round(scale * gain * 1e6)
+    __VERTICAL_SCALES_UV = frozenset(round(v * 1e6) for v in __VERTICAL_SCALES)
+    __VERTICAL_SCALES_SORTED = tuple(sorted(__VERTICAL_SCALES))
+
+    __BANDWIDTHS = frozenset({20_000_000, 200_000_000})
+    __BANDWIDTHS_SORTED = tuple(sorted(__BANDWIDTHS))
+
+    # SCPI command prefixes, completed with the value at call time. Per-channel
+    # tables are indexed by channel number (entry 0 is unused).
+    __CH = range(__NUM_CHANNELS + 1)
+    __CMD_SEL = tuple(f":SEL:CH{c} " for c in __CH)
+    __CMD_SCA = tuple(f":CH{c}:SCA " for c in __CH)
+    __CMD_COUP = tuple(f":CH{c}:COUP " for c in __CH)
+    __CMD_POS = tuple(f":CH{c}:POS " for c in __CH)
+    __CMD_GAIN = tuple(f":CH{c}:PRO:GAIN " for c in __CH)
+    __CMD_BAN = tuple(f":CH{c}:BAN " for c in __CH)
+    __CMD_TRIG_SOU = tuple(f":TRIG:A:EDGE:SOU CH{c}" for c in __CH)
+    __CMD_DAT_SOU = tuple(f":DAT:SOU CH{c}" for c in __CH)
+    __QRY_SEL = tuple(f":SEL:CH{c}?" for c in __CH)
+    __QRY_SCA = tuple(f":CH{c}:SCA?" for c in __CH)
+    __QRY_COUP = tuple(f":CH{c}:COUP?" for c in __CH)
+    __QRY_POS = tuple(f":CH{c}:POS?" for c in __CH)
+    __QRY_GAIN = tuple(f":CH{c}:PRO:GAIN?" for c in __CH)
+    __QRY_BAN = tuple(f":CH{c}:BAN?" for c in __CH)
+    __QRY_WFMO_SCALES = (
+        ":WFMO:YMULT?;:WFMO:YOFF?;:WFMO:YZERO?;:WFMO:XINCR?;:WFMO:XZERO?"
+    )
+    __CMD_HOR_SCA = ":HOR:SCA "
+    __CMD_HOR_POS = ":HOR:DEL:MOD OFF;:HOR:POS "
+    __CMD_HOR_RECO = ":HOR:RECO "
+    __CMD_TRIG_MOD = ":TRIG:A:MOD "
+    __CMD_TRIG_LEV = ":TRIG:A:LEV "
+    __CMD_TRIG_SLO = ":TRIG:A:EDGE:SLO "
 
-    __BANDWIDTHS = {20_000_000, 200_000_000}
+    __TRIG_SOURCE_RE = re.compile(r"CH(\d+)")  # e.g. "CH2" -> 2; LINE/EXT -> None
 
     def __init__(
-        self, resource: str, timeout: int = 20000, verbose: bool = True
+        self,
+        resource: str,
+        timeout: int = 20000,
+        verbose: bool = True,
+        chunk_size: int = 2_000_000,
     ) -> None:
         """
         Initialize connection to the Tektronix TBS2204B oscilloscope.
@@ -166,6 +242,13 @@ class TBS2204B(Instrument):
         self.verbose = verbose
         self.timeout = timeout
         self.resource = resource
+        self.chunk_size = chunk_size
+        self._gain_cache = {}  # channel -> probe gain, written by set_channel_gain
+        self._scale_cache = {}  # channel -> V/div, written by set_channel_scale
+        self._pos_cache = {}  # channel -> div, written by set_channel_position
+        self._trig_source_cache = None  # written by set_trigger_source
+        self._x_cache = None  # (n, xincr, xzero, x) of the last time axis
+        self._dat_source_cache = None  # channel the :DAT settings were sent for
         self.connect()
 
     # ------------------------------------------------------------------
@@ -175,10 +258,12 @@ class TBS2204B(Instrument):
         """
         Establish the VISA connection with the oscilloscope.
 
-        This method initializes the VISA Resource Manager, opens the USB
-        connection to the instrument, and configures the communication
-        timeout. It also performs an identification query to ensure
-        the instrument is responsive.
+        This method opens the USB connection to the instrument through the
+        process-wide VISA Resource Manager (created on first use), and
+        configures the communication timeout, read chunk size and
+        termination characters. Over ``TCPIP`` resources, Nagle's algorithm
+        is disabled. It also performs an identification query to ensure the
+        instrument is responsive.
 
         Raises
         ------
@@ -188,19 +273,40 @@ class TBS2204B(Instrument):
             If the instrument fails to respond to the identification query.
         """
         try:
-            rm = pyvisa.ResourceManager()
-            self.inst = rm.open_resource(self.resource)
+            self.inst = get_rm().open_resource(self.resource)
+            # Bound once for the setters, which may run in tight sweeps
+            self._w = self.inst.write
+            self._q = self.inst.query
             self.inst.timeout = self.timeout
+            self.inst.chunk_size = self.chunk_size
+            # No read termination character: binary blocks are then read up to
+            # END without stopping on 0x0A data bytes. Text replies keep their
+            # newline, which the getters strip or the numeric parse ignores.
+            self.inst.read_termination = None
+            self.inst.write_termination = "\n"
+            self.inst.send_end = True
+            if self.resource.upper().startswith("TCPIP"):
+                # Disable Nagle's algorithm, which delays short SCPI queries
+                self.inst.set_visa_attribute(
+                    pyvisa.constants.VI_ATTR_TCPIP_NODELAY, pyvisa.constants.VI_TRUE
+                )
         except Exception as e:
             raise ConnectionError(
                 f"[TBS2204B][ERROR] Could not connect to oscilloscope: {e}"
             )
         try:
             self.idn()
-            if self.verbose:
-                print("[TBS2204B] Connected successfully.")
         except Exception as e:
             raise RuntimeError(f"[TBS2204B][ERROR] Failed to query IDN: {e}")
+        try:
+            # OPC -> ESB (ESE bit 0), ESB -> SRQ (SRE bit 5), for single_acquisition
+            self.inst.write("*ESE 1;*SRE 32")
+        except Exception as e:
+            raise RuntimeError(
+                f"[TBS2204B][ERROR] Failed to enable the OPC service request: {e}"
+            )
+        if self.verbose:
+            logger.info("Connected successfully.")
 
     def idn(self) -> str:
         """
@@ -213,7 +319,7 @@ class TBS2204B(Instrument):
         """
         idn = self.inst.query("*IDN?").strip()
         if self.verbose:
-            print(f"[TBS2204B] IDN: {idn}.")
+            logger.info("IDN: %s.", idn)
         return idn
 
     def clear(self) -> None:
@@ -222,23 +328,38 @@ class TBS2204B(Instrument):
         """
         self.inst.write("*CLS")
         if self.verbose:
-            print("[TBS2204B] Status registers cleared.")
+            logger.info("Status registers cleared.")
 
     def reset(self) -> None:
         """
         Reset the oscilloscope to factory default configuration.
         """
         self.inst.write("*RST")
+        self.invalidate_cache()
         if self.verbose:
-            print("[TBS2204B] Instrument reset to defaults.")
+            logger.info("Instrument reset to defaults.")
 
     def autoset(self) -> None:
         """
         Automatically configure the oscilloscope for a stable waveform display.
         """
         self.inst.write(":AUTOS EXEC")
+        self.invalidate_cache()
         if self.verbose:
-            print("[TBS2204B] Autoset executed successfully.")
+            logger.info("Autoset executed successfully.")
+
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached channel and trigger settings.
+
+        The next call that needs them queries the instrument again. Call this
+        if settings may have been changed from the front panel.
+        """
+        self._gain_cache.clear()
+        self._scale_cache.clear()
+        self._pos_cache.clear()
+        self._trig_source_cache = None
+        self._dat_source_cache = None
 
     def close(self) -> None:
         """
@@ -247,6 +368,8 @@ class TBS2204B(Instrument):
         Notes
         -----
         Should always be called before program termination to release the USB resource.
+        Only the instrument session is closed; the shared Resource Manager stays
+        open for other instances until :meth:`shutdown_rm` is called.
 
         Raises
         ------
@@ -256,13 +379,35 @@ class TBS2204B(Instrument):
         try:
             self.inst.close()
             if self.verbose:
-                print("[TBS2204B] Connection closed.")
+                logger.info("Connection closed.")
         except Exception as e:
             raise RuntimeError(f"[TBS2204B][ERROR] Failed to close connection: {e}")
 
+    @classmethod
+    def shutdown_rm(cls) -> None:
+        """
+        Close the process-wide VISA Resource Manager.
+
+        The manager is shared by all VISA drivers of the package (see
+        `fastruments.helpers.get_rm`), so any instrument still connected
+        through it, of any type, becomes unusable. The next
+        call to :meth:`connect` creates a fresh Resource Manager.
+        """
+        shutdown_rm()
+
     # ------------------------------------------------------------------
     # Channel control
     # ------------------------------------------------------------------
+    def _validate_channel(self, channel: int) -> None:
+        """
+        Raise ``ValueError`` if `channel` is not a valid channel number.
+        """
+        if channel not in self.__VALID_CHANNELS:
+            raise ValueError(
+                f"[TBS2204B][ERROR] Invalid channel {channel}. "
+                f"Must be between 1 and {self.__NUM_CHANNELS}."
+            )
+
     def set_channel_display(self, channel: int, state: bool) -> None:
         """
         Enable or disable a specific channel display.
@@ -279,13 +424,10 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
-        self.inst.write(f":SEL:CH{channel} {'ON' if state else 'OFF'}")
+        self._validate_channel(channel)
+        self._w(self.__CMD_SEL[channel] + ("ON" if state else "OFF"))
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} display set to {'ON' if state else 'OFF'}.")
+            logger.info("CH%s display set to %s.", channel, "ON" if state else "OFF")
 
     def set_channel_scale(self, channel: int, scale: float) -> None:
         """
@@ -309,7 +451,8 @@ class TBS2204B(Instrument):
 
             scale * gain ∈ __VERTICAL_SCALES
 
-        where the gain is obtained from `get_channel_gain(channel)`.
+        where the gain is the one last set with `set_channel_gain(channel)`,
+        or read once from the instrument with `get_channel_gain(channel)`.
 
         Therefore:
             - changing the channel gain modifies the valid scale values
@@ -322,19 +465,18 @@ class TBS2204B(Instrument):
             If the channel number is outside the valid range.
             If the requested vertical scale is not valid for the channel’s current gain.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
-        gain = self.get_channel_gain(channel)
-        if scale * gain not in self.__VERTICAL_SCALES:
+        self._validate_channel(channel)
+        gain = self._cached_gain(channel)
+        if round(scale * gain * 1e6) not in self.__VERTICAL_SCALES_UV:
+            valid = tuple(v / gain for v in self.__VERTICAL_SCALES_SORTED)
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid scale {scale} V/div for gain {gain}. "
-                f"Valid vertical scales are: {sorted(self.__VERTICAL_SCALES/gain)}."
+                f"Valid vertical scales are: {valid}."
             )
-        self.inst.write(f":CH{channel}:SCA {scale}")
+        self._w(self.__CMD_SCA[channel] + str(scale))
+        self._scale_cache[channel] = scale
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} scale set to {scale} V/div.")
+            logger.info("CH%s scale set to %s V/div.", channel, scale)
 
     def set_channel_coupling(self, channel: int, mode: str) -> None:
         """
@@ -354,19 +496,16 @@ class TBS2204B(Instrument):
             If the channel number is outside the valid range.
             If the coupling mode is not supported.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
+        self._validate_channel(channel)
         mode = mode.upper()
         if mode not in self.__COUPLING_MODES:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid coupling mode '{mode}'. "
-                f"Valid options: {sorted(self.__COUPLING_MODES)}."
+                f"Valid options: {self.__COUPLING_MODES_SORTED}."
             )
-        self.inst.write(f":CH{channel}:COUP {mode}")
+        self._w(self.__CMD_COUP[channel] + mode)
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} coupling set to {mode}.")
+            logger.info("CH%s coupling set to %s.", channel, mode)
 
     def set_channel_position(self, channel: int, position: float) -> None:
         """
@@ -387,19 +526,17 @@ class TBS2204B(Instrument):
             If the channel number is outside the valid range.
             If the vertical position is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
+        self._validate_channel(channel)
         low, high = self.__VERTICAL_POSITION_RANGE
         if not (low <= position <= high):
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid CH{channel} position {position}. "
                 f"Valid range: [{low}, {high}] div."
             )
-        self.inst.write(f":CH{channel}:POS {position}")
+        self._w(self.__CMD_POS[channel] + str(position))
+        self._pos_cache[channel] = position
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} vertical position set to {position} div.")
+            logger.info("CH%s vertical position set to %s div.", channel, position)
 
     def set_channel_gain(self, channel: int, gain: float) -> None:
         """
@@ -423,20 +560,19 @@ class TBS2204B(Instrument):
             If the channel number is outside the valid range.
             If the gain value is not one of the supported values.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
+        self._validate_channel(channel)
 
         if gain not in self.__VERTICAL_GAINS:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid gain {gain}. "
-                f"Valid values: {sorted(self.__VERTICAL_GAINS)}."
+                f"Valid values: {self.__VERTICAL_GAINS_SORTED}."
             )
 
-        self.inst.write(f":CH{channel}:PRO:GAIN {gain}")
+        self._w(self.__CMD_GAIN[channel] + str(gain))
+        self._gain_cache[channel] = gain
+        self._scale_cache.pop(channel, None)  # the scale follows the gain
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} gain set to {gain}.")
+            logger.info("CH%s gain set to %s.", channel, gain)
 
     def set_channel_bandwidth(self, channel: int, bandwidth: float) -> None:
         """
@@ -456,19 +592,16 @@ class TBS2204B(Instrument):
             If the channel number is outside the valid range.
             If the bandwidth value is not supported.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
+        self._validate_channel(channel)
 
         if bandwidth not in self.__BANDWIDTHS:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid bandwidth {bandwidth}. "
-                f"Valid values: {sorted(self.__BANDWIDTHS)}."
+                f"Valid values: {self.__BANDWIDTHS_SORTED}."
             )
-        self.inst.write(f":CH{channel}:BAN {bandwidth}")
+        self._w(self.__CMD_BAN[channel] + str(bandwidth))
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} bandwidth set to {bandwidth/1e6} MHz.")
+            logger.info("CH%s bandwidth set to %s MHz.", channel, bandwidth / 1e6)
 
     def get_channel_position(self, channel: int) -> float:
         """
@@ -489,13 +622,10 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
-        pos = float(self.inst.query(f":CH{channel}:POS?"))
+        self._validate_channel(channel)
+        pos = float(self._q(self.__QRY_POS[channel]))
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} vertical position is {pos} div.")
+            logger.info("CH%s vertical position is %s div.", channel, pos)
         return pos
 
     def get_channel_display(self, channel: int) -> bool:
@@ -517,16 +647,11 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
-        state = self.inst.query(f":SEL:CH{channel}?").strip()
+        self._validate_channel(channel)
+        state = bool(int(self._q(self.__QRY_SEL[channel])))
         if self.verbose:
-            print(
-                f"[TBS2204B] CH{channel} display is {'ON' if state == '1' else 'OFF'}."
-            )
-        return state == "1"
+            logger.info("CH%s display is %s.", channel, "ON" if state else "OFF")
+        return state
 
     def get_channel_scale(self, channel: int) -> float:
         """
@@ -547,11 +672,10 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(f"[TBS2204B][ERROR] Invalid channel {channel}.")
-        scale = float(self.inst.query(f":CH{channel}:SCA?"))
+        self._validate_channel(channel)
+        scale = float(self._q(self.__QRY_SCA[channel]))
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} scale is {scale} V/div.")
+            logger.info("CH%s scale is %s V/div.", channel, scale)
         return scale
 
     def get_channel_coupling(self, channel: int) -> str:
@@ -573,11 +697,10 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(f"[TBS2204B][ERROR] Invalid channel {channel}.")
-        coupling = self.inst.query(f":CH{channel}:COUP?").strip()
+        self._validate_channel(channel)
+        coupling = self._q(self.__QRY_COUP[channel]).strip()
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} coupling is {coupling}.")
+            logger.info("CH%s coupling is %s.", channel, coupling)
         return coupling
 
     def get_channel_gain(self, channel: int) -> float:
@@ -599,13 +722,19 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
-        gain = float(self.inst.query(f":CH{channel}:PRO:GAIN?"))
+        self._validate_channel(channel)
+        gain = float(self._q(self.__QRY_GAIN[channel]))
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} gain is {gain}.")
+            logger.info("CH%s gain is %s.", channel, gain)
+        return gain
+
+    def _cached_gain(self, channel: int) -> float:
+        """
+        Return the channel gain, querying the instrument only on a cache miss.
+        """
+        gain = self._gain_cache.get(channel)
+        if gain is None:
+            gain = self._gain_cache[channel] = self.get_channel_gain(channel)
         return gain
 
     def get_channel_bandwidth(self, channel: int) -> float:
@@ -627,13 +756,10 @@ class TBS2204B(Instrument):
         ValueError
             If the channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
-        bandwidth = float(self.inst.query(f":CH{channel}:BAN?"))
+        self._validate_channel(channel)
+        bandwidth = float(self._q(self.__QRY_BAN[channel]))
         if self.verbose:
-            print(f"[TBS2204B] CH{channel} bandwidth is {bandwidth/1e6} MHz.")
+            logger.info("CH%s bandwidth is %s MHz.", channel, bandwidth / 1e6)
         return bandwidth
 
     # ------------------------------------------------------------------
@@ -663,14 +789,14 @@ class TBS2204B(Instrument):
         ValueError
             If the requested timebase scale is not supported by the instrument.
         """
-        if scale not in self.__TIMEBASE_SCALES:
+        if round(scale * 1e12) not in self.__TIMEBASE_SCALES_PS:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid timebase scale {scale}. "
-                f"Valid values are: {sorted(self.__TIMEBASE_SCALES)}."
+                f"Valid values are: {self.__TIMEBASE_SCALES_SORTED}."
             )
-        self.inst.write(f":HOR:SCA {scale}")
+        self._w(self.__CMD_HOR_SCA + str(scale))
         if self.verbose:
-            print(f"[TBS2204B] Timebase scale set to {scale} s/div.")
+            logger.info("Timebase scale set to %s s/div.", scale)
 
     def set_timebase_position(self, position: float) -> None:
         """
@@ -690,12 +816,11 @@ class TBS2204B(Instrument):
             raise ValueError(
                 "[TBS2204B][ERROR] Timebase position must be between 0 and 100%."
             )
-        self.inst.write(
-            ":HOR:DEL:MOD OFF"
-        )  # Changing the position does not work when a delay is applied
-        self.inst.write(f":HOR:POS {position}")
+        # Changing the position does not work when a delay is applied, so turn
+        # delay mode off in the same message
+        self._w(self.__CMD_HOR_POS + str(position))
         if self.verbose:
-            print(f"[TBS2204B] Timebase position set to {position}%.")
+            logger.info("Timebase position set to %s%%.", position)
 
     def get_timebase_scale(self) -> float:
         """
@@ -707,9 +832,9 @@ class TBS2204B(Instrument):
             Time scale per division in s/div.
 
         """
-        scale = float(self.inst.query(":HOR:SCA?"))
+        scale = float(self._q(":HOR:SCA?"))
         if self.verbose:
-            print(f"[TBS2204B] Timebase scale is {scale} s/div.")
+            logger.info("Timebase scale is %s s/div.", scale)
         return scale
 
     def get_timebase_position(self) -> float:
@@ -721,9 +846,9 @@ class TBS2204B(Instrument):
         float
             Horizontal timebase offset in percentage of the waveform displayed.
         """
-        pos = float(self.inst.query(":HOR:DEL:POS?"))
+        pos = float(self._q(":HOR:DEL:POS?"))
         if self.verbose:
-            print(f"[TBS2204B] Timebase position is {pos}%.")
+            logger.info("Timebase position is %s%%.", pos)
         return pos
 
     # ------------------------------------------------------------------
@@ -748,11 +873,11 @@ class TBS2204B(Instrument):
         if mode not in self.__TRIGGER_MODES:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid trigger mode '{mode}'. "
-                f"Valid options: {sorted(self.__TRIGGER_MODES)}."
+                f"Valid options: {self.__TRIGGER_MODES_SORTED}."
             )
-        self.inst.write(f":TRIG:A:MOD {mode}")
+        self._w(self.__CMD_TRIG_MOD + mode)
         if self.verbose:
-            print(f"[TBS2204B] Trigger mode set to {mode}.")
+            logger.info("Trigger mode set to %s.", mode)
 
     def set_trigger_source(self, channel: int) -> None:
         """
@@ -768,13 +893,14 @@ class TBS2204B(Instrument):
         ValueError
             If the trigger source channel number is outside the valid range.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
+        if channel not in self.__VALID_CHANNELS:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid source channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
             )
-        self.inst.write(f":TRIG:A:EDGE:SOU CH{channel}")
+        self._w(self.__CMD_TRIG_SOU[channel])
+        self._trig_source_cache = channel
         if self.verbose:
-            print(f"[TBS2204B] Trigger source set to CH{channel}.")
+            logger.info("Trigger source set to CH%s.", channel)
 
     def set_trigger_level(self, level: float) -> None:
         """
@@ -797,6 +923,9 @@ class TBS2204B(Instrument):
             - the vertical position (divisions) of that channel is obtained from
             `get_channel_position()`
 
+        These values are cached after the first query and kept up to date by
+        the corresponding setters, so repeated calls only write the level.
+
         The oscilloscope internally limits the trigger point to a maximum vertical
         span of ±4.96 divisions from the center. Therefore, the valid level range is:
 
@@ -811,9 +940,15 @@ class TBS2204B(Instrument):
         ValueError
             If the trigger level is outside the valid range for the current trigger source settings.
         """
-        source = self.get_trigger_source()
-        scale = self.get_channel_scale(source)
-        position = self.get_channel_position(source)
+        source = self._trig_source_cache
+        if source is None:
+            source = self._trig_source_cache = self.get_trigger_source()
+        scale = self._scale_cache.get(source)
+        if scale is None:
+            scale = self._scale_cache[source] = self.get_channel_scale(source)
+        position = self._pos_cache.get(source)
+        if position is None:
+            position = self._pos_cache[source] = self.get_channel_position(source)
         min_allowed = -(4.96 + position) * scale
         max_allowed = +(4.96 - position) * scale
         if not (min_allowed <= level <= max_allowed):
@@ -821,9 +956,9 @@ class TBS2204B(Instrument):
                 f"[TBS2204B][ERROR] Trigger level {level} V exceeds valid range "
                 f"[{min_allowed}, {max_allowed}] V for source {source}."
             )
-        self.inst.write(f":TRIG:A:LEV {level}")
+        self._w(self.__CMD_TRIG_LEV + str(level))
         if self.verbose:
-            print(f"[TBS2204B] Trigger level set to {level} V.")
+            logger.info("Trigger level set to %s V.", level)
 
     def set_trigger_slope(self, slope: str) -> None:
         """
@@ -844,11 +979,11 @@ class TBS2204B(Instrument):
         if slope not in self.__TRIGGER_SLOPES:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid trigger slope '{slope}'. "
-                f"Valid options: {sorted(self.__TRIGGER_SLOPES)}."
+                f"Valid options: {self.__TRIGGER_SLOPES_SORTED}."
             )
-        self.inst.write(f":TRIG:A:EDGE:SLO {slope}")
+        self._w(self.__CMD_TRIG_SLO + slope)
         if self.verbose:
-            print(f"[TBS2204B] Trigger slope set to {slope}.")
+            logger.info("Trigger slope set to %s.", slope)
 
     def get_trigger_mode(self) -> str:
         """
@@ -859,9 +994,9 @@ class TBS2204B(Instrument):
         str
             Trigger mode as in `__TRIGGER_MODES`.
         """
-        mode = self.inst.query(":TRIG:A:MOD?").strip()
+        mode = self._q(":TRIG:A:MOD?").strip()
         if self.verbose:
-            print(f"[TBS2204B] Trigger mode is {mode}.")
+            logger.info("Trigger mode is %s.", mode)
         return mode
 
     def get_trigger_source(self) -> int:
@@ -873,13 +1008,10 @@ class TBS2204B(Instrument):
         int
             Trigger source channel.
         """
-        source = self.inst.query(":TRIG:A:EDGE:SOU?").strip()
-        if source.startswith("CH"):
-            channel = int(source.replace("CH", ""))
-        else:
-            channel = None
+        match = self.__TRIG_SOURCE_RE.match(self._q(":TRIG:A:EDGE:SOU?"))
+        channel = int(match.group(1)) if match else None
         if self.verbose:
-            print(f"[TBS2204B] Trigger source is CH{channel}.")
+            logger.info("Trigger source is CH%s.", channel)
         return channel
 
     def get_trigger_level(self) -> float:
@@ -891,9 +1023,9 @@ class TBS2204B(Instrument):
         float
             Trigger level in volts.
         """
-        level = float(self.inst.query(":TRIG:A:LEV?"))
+        level = float(self._q(":TRIG:A:LEV?"))
         if self.verbose:
-            print(f"[TBS2204B] Trigger level is {level} V.")
+            logger.info("Trigger level is %s V.", level)
         return level
 
     def get_trigger_slope(self) -> str:
@@ -905,9 +1037,9 @@ class TBS2204B(Instrument):
         str
             Slope mode as in `__TRIGGER_SLOPES`.
         """
-        slope = self.inst.query(":TRIG:A:EDGE:SLO?").strip()
+        slope = self._q(":TRIG:A:EDGE:SLO?").strip()
         if self.verbose:
-            print(f"[TBS2204B] Trigger slope is {slope}.")
+            logger.info("Trigger slope is %s.", slope)
         return slope
 
     # ------------------------------------------------------------------
@@ -926,9 +1058,10 @@ class TBS2204B(Instrument):
         Returns
         -------
         x : numpy.ndarray
-            Time axis in seconds.
+            Time axis in seconds. Read-only, and shared between calls that
+            return the same axis; copy it before modifying.
         y : numpy.ndarray
-            Waveform samples in volts.
+            Waveform samples in volts (``float32``).
 
         Raises
         ------
@@ -936,37 +1069,97 @@ class TBS2204B(Instrument):
             If the channel number is outside the valid range.
             If the channel display is OFF when attempting to acquire a waveform.
         """
-        if not (1 <= channel <= self.__NUM_CHANNELS):
-            raise ValueError(
-                f"[TBS2204B][ERROR] Invalid channel {channel}. Must be between 1 and {self.__NUM_CHANNELS}."
-            )
+        self._validate_channel(channel)
         if not self.get_channel_display(channel):
-            raise ValueError(
-                f"[TBS2204B][ERROR] CH{channel} is OFF. "
-                "Enable it with set_channel_display(channel, True) before acquiring waveforms."
+            raise self._display_off_error(channel)
+        return self._download_waveform(channel)
+
+    @staticmethod
+    def _display_off_error(channel: int) -> ValueError:
+        return ValueError(
+            f"[TBS2204B][ERROR] CH{channel} is OFF. "
+            "Enable it with set_channel_display(channel, True) before acquiring waveforms."
+        )
+
+    def _download_waveform(self, channel: int) -> tuple[np.ndarray, np.ndarray]:
+        """Transfer and scale the record of a validated, displayed channel."""
+        # Signed binary, one byte per sample, whole record of the channel. The
+        # settings persist on the instrument, so repeated downloads from the
+        # same channel skip this write.
+        if self._dat_source_cache != channel:
+            self.inst.write(
+                f"{self.__CMD_DAT_SOU[channel]};:DAT:ENC RIB;:DAT:WID 1;"
+                f":DAT:STAR 1;:DAT:STOP {self.__MAX_RECORD_LENGTH}"
             )
-        self.inst.write(":DAT:ENC ASCI")  # Set data encoding to ASCII
-        self.inst.write(f":DAT:SOU CH{channel}")  # Set channel
-        self.inst.write(":DAT:STAR 1")  # Get entire record (left)
-        self.inst.write(
-            f":DAT:STOP {np.max(self.__RECORD_LENGTHS)}"
-        )  # Get entire record (right)
+            self._dat_source_cache = channel
         if self.verbose:
-            print(f"[TBS2204B] Donwloading data points from CH{channel}...")
-        raw_data = self.inst.query(":CURV?")  # Get raw data
-        raw = np.fromstring(raw_data, sep=",")
-        ymult = float(self.inst.query(":WFMO:YMULT?"))  # Get Y parameters
-        yoff = float(self.inst.query(":WFMO:YOFF?"))
-        yzero = float(self.inst.query(":WFMO:YZERO?"))
-        y = (raw - yoff) * ymult + yzero  # Convert to voltage
-        xincr = float(self.inst.query(":WFMO:XINCR?"))  # Get X parameters
-        xzero = float(self.inst.query(":WFMO:XZERO?"))
-        n = len(raw)  # Convert to time
-        x = np.arange(n) * xincr + xzero
+            logger.info("Downloading data points from CH%s...", channel)
+        raw = self.inst.query_binary_values(
+            ":CURV?", datatype="b", is_big_endian=True, container=np.ndarray
+        )  # Get raw data as a single IEEE 488.2 block
+        # Get Y and X scale factors in one round-trip
+        ymult, yoff, yzero, xincr, xzero = map(
+            float, self.inst.query(self.__QRY_WFMO_SCALES).split(";")
+        )
+        # Convert to voltage as y = raw * ymult + (yzero - yoff * ymult), in
+        # place and in float32: the 8-bit samples need no more precision, and
+        # a 5M-point record needs a single output buffer
+        y = np.empty(raw.size, dtype=np.float32)
+        np.multiply(raw, ymult, out=y, dtype=np.float32)
+        y += np.float32(yzero - yoff * ymult)
+        n = raw.size  # Convert to time, reusing the last axis if it still fits
+        key = (n, xincr, xzero)
+        if self._x_cache is not None and self._x_cache[:3] == key:
+            x = self._x_cache[3]
+        else:
+            x = np.arange(n, dtype=np.float64) * xincr + xzero
+            x.flags.writeable = False
+            self._x_cache = (*key, x)
         if self.verbose:
-            print(f"[TBS2204B] {n} points downloaded from CH{channel}.")
+            logger.info("%s points downloaded from CH%s.", n, channel)
         return x, y
 
+    def get_waveforms(
+        self, channels: Sequence[int]
+    ) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+        """
+        Acquire waveforms from several channels.
+
+        Parameters
+        ----------
+        channels : sequence of int
+            Channel numbers. Valid values are between 1 and `__MAX_CHANNELS`.
+
+        Returns
+        -------
+        dict
+            Mapping channel -> ``(x, y)`` as returned by `get_waveform()`.
+
+        Raises
+        ------
+        ValueError
+            If any channel number is outside the valid range, or any channel
+            display is OFF. Nothing is downloaded in that case.
+
+        Notes
+        -----
+        The display states of all channels are checked with one compound
+        query before the first transfer. The transfers share one VISA session
+        and run back to back; issuing them from parallel threads would
+        interleave the SCPI exchanges. To overlap downloads from *different*
+        oscilloscopes, wrap each one in
+        :class:`fastruments.helpers.AsyncInstrument`.
+        """
+        for channel in channels:
+            self._validate_channel(channel)
+        if not channels:
+            return {}
+        states = self.inst.query(";".join(self.__QRY_SEL[c] for c in channels))
+        for channel, state in zip(channels, states.split(";")):
+            if not int(state):
+                raise self._display_off_error(channel)
+        return {channel: self._download_waveform(channel) for channel in channels}
+
     def start_acquisition(self) -> None:
         """
         Start continuous acquisition (RUN mode).
@@ -979,12 +1172,27 @@ class TBS2204B(Instrument):
         self.inst.write(":ACQ:STOPA RUNST")
         self.inst.write(":ACQ:STATE RUN")
         if self.verbose:
-            print("[TBS2204B] Acquisition started (continuous mode).")
+            logger.info("Acquisition started (continuous mode).")
 
-    def single_acquisition(self) -> None:
+    def single_acquisition(self, timeout: Optional[float] = None) -> None:
         """
         Perform a single-sequence acquisition.
 
+        The sequence is armed together with *OPC, and completion is awaited
+        on the service request (see `fastruments.helpers.wait_for_opc`)
+        instead of a blocking *OPC? read, so the wait is bounded and a
+        KeyboardInterrupt is handled within 100 ms.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum waiting time in seconds. Defaults to the VISA timeout.
+
+        Raises
+        ------
+        TimeoutError
+            If the sequence is not acquired within `timeout`.
+
         Notes
         -----
         After completing the acquisition the oscilloscope stops automatically.
@@ -992,13 +1200,18 @@ class TBS2204B(Instrument):
         that once you have changed the measurement parameters it is always a
         good idea to acquire again the sequence.
         """
-        self.inst.write(":ACQ:STOPA SEQ")
+        if timeout is None:
+            timeout = self.timeout / 1000
         if self.verbose:
-            print("[TBS2204B] Single-sequence acquisition started.")
-        self.inst.write(":ACQ:STATE RUN")
-        self.inst.query("*OPC?")
+            logger.info("Single-sequence acquisition started.")
+        # Queue the SRQ before arming: with AUTO trigger or a fast timebase
+        # the sequence can complete before the write returns
+        srq = enable_srq(self.inst)
+        # *CLS drops a stale OPC event before arming the new sequence
+        self.inst.write("*CLS;:ACQ:STOPA SEQ;:ACQ:STATE RUN;*OPC")
+        wait_for_opc(self.inst, timeout, "TBS2204B", srq=srq)
         if self.verbose:
-            print("[TBS2204B] Single-sequence acquisition completed.")
+            logger.info("Single-sequence acquisition completed.")
 
     def stop_acquisition(self) -> None:
         """
@@ -1006,7 +1219,7 @@ class TBS2204B(Instrument):
         """
         self.inst.write(":ACQ:STATE STOP")
         if self.verbose:
-            print("[TBS2204B] Acquisition stopped.")
+            logger.info("Acquisition stopped.")
 
     def get_acquisition_state(self) -> bool:
         """
@@ -1017,12 +1230,40 @@ class TBS2204B(Instrument):
         bool
             ``True`` if acquisition is running, ``False`` if stopped.
         """
-        state = self.inst.query(":ACQ:STATE?").strip()
+        state = bool(int(self.inst.query(":ACQ:STATE?")))
+        if self.verbose:
+            logger.info("Acquisition state: %s.", "RUNNING" if state else "STOPPED")
+        return state
+
+    def get_state_bundle(self) -> dict:
+        """
+        Query acquisition, trigger and busy state in a single round-trip.
+
+        Meant for polling loops: the three queries are sent as one compound
+        message instead of three.
+
+        Returns
+        -------
+        dict
+            ``{"acq": bool, "trig": str, "busy": bool}``, where ``acq`` is
+            ``True`` while acquiring, ``trig`` is the trigger state (e.g.
+            ``"ARMED"``, ``"READY"``, ``"TRIGGER"``, ``"AUTO"``) and ``busy``
+            is ``True`` while an operation is pending.
+        """
+        acq, trig, busy = self.inst.query(":ACQ:STATE?;:TRIG:STATE?;:BUSY?").split(";")
+        bundle = {
+            "acq": acq.strip() == "1",
+            "trig": trig.strip(),
+            "busy": busy.strip() == "1",
+        }
         if self.verbose:
-            print(
-                f"[TBS2204B] Acquisition state: {'RUNNING' if state == '1' else 'STOPPED'}."
+            logger.info(
+                "Acquisition: %s, trigger: %s, busy: %s.",
+                "RUNNING" if bundle["acq"] else "STOPPED",
+                bundle["trig"],
+                bundle["busy"],
             )
-        return state == "1"
+        return bundle
 
     def set_record_length(self, length: int) -> None:
         """
@@ -1042,11 +1283,11 @@ class TBS2204B(Instrument):
         if length not in self.__RECORD_LENGTHS:
             raise ValueError(
                 f"[TBS2204B][ERROR] Invalid record length {length}. "
-                f"Valid options: {self.__RECORD_LENGTHS}."
+                f"Valid options: {self.__RECORD_LENGTHS_SORTED}."
             )
-        self.inst.write(f":HOR:RECO {length}")
+        self._w(self.__CMD_HOR_RECO + str(length))
         if self.verbose:
-            print(f"[TBS2204B] Record length set to {length} points.")
+            logger.info("Record length set to %s points.", length)
 
     def get_record_length(self) -> int:
         """
@@ -1057,9 +1298,9 @@ class TBS2204B(Instrument):
         int
             Record length in points.
         """
-        length = int(self.inst.query("HOR:RECO?"))
+        length = int(self._q("HOR:RECO?"))
         if self.verbose:
-            print(f"[TBS2204B] Record length is {length} points.")
+            logger.info("Record length is %s points.", length)
         return length
 
 
@@ -1,5 +1,9 @@
 import ctypes
 import pathlib
+import queue
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 from typing import Optional
 from fastruments.helpers import DllBinder
@@ -20,6 +24,11 @@ CAL_PATH = (
 )
 
 
+def _save_image(frame: np.ndarray, filename: str) -> None:
+    """Encode and write a frame to disk (run on the save pool)."""
+    Image.fromarray(frame).save(filename)
+
+
 class XenicsError(RuntimeError):
     """Exception raised for Xenics DLL errors."""
 
@@ -161,6 +170,20 @@ class XenicsDLL:
 
 class Xenics(Instrument):
 
+    # Bytes per pixel, indexed by frame type + 1
+    _PIXEL_SIZES = (
+        0,  # -1 UNKNOWN
+        0,  # 0 NATIVE
+        1,  # 1 8 BPP GRAY
+        2,  # 2 16 BPP GRAY
+        4,  # 3 32 BPP GRAY
+        4,  # 4 RGBA
+        4,  # 5 RGB
+        4,  # 6 BGRA
+        4,  # 7 BGR
+    )
+    _PIXEL_DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32}  # bytes -> dtype
+
     def __init__(
         self,
         url: str = "cam://0",
@@ -172,6 +195,7 @@ class Xenics(Instrument):
 
         self._cam: int | None = None
         self._url: str = url
+        self._url_bytes: bytes = url.encode("utf-8")
 
         # Status
         self._is_open = False
@@ -181,6 +205,31 @@ class Xenics(Instrument):
         self._dll: XenicsDLL = dll
         self._calibration_file: str | None = calibration_file
         self._settings_file: str | None = settings_file
+        # Encoded once for the SDK calls, kept in sync by the setters
+        self._calibration_bytes: bytes | None = self._encode_path(calibration_file)
+        self._settings_bytes: bytes | None = self._encode_path(settings_file)
+
+        # Frame buffer handed to XC_GetFrame, reused across grabs
+        self._frame_buf: ctypes.Array | None = None
+        # (frame_size, frame_type, height, width), read once per session
+        self._frame_info: tuple[int, int, int, int] | None = None
+
+        # Background streaming (see start_stream)
+        self._stream_thread: threading.Thread | None = None
+        self._stream_stop = threading.Event()
+        self._stream_error: BaseException | None = None
+        self._ring: list[np.ndarray] = []  # raw SDK frame buffers
+        self._ring_frames: list[np.ndarray] = []  # pixel views on self._ring
+        self._free: queue.Queue = queue.Queue()
+        self._ready: queue.Queue = queue.Queue()
+
+        # Image encoding runs off the acquisition path (see flush)
+        self._save_pool: ThreadPoolExecutor | None = None  # created on first grab
+        self._pending_saves: list[Future] = []
+
+    @staticmethod
+    def _encode_path(filepath: str | None) -> bytes | None:
+        return None if filepath is None else str(filepath).encode("utf-8")
 
     @property
     def url(self) -> str:
@@ -227,7 +276,8 @@ class Xenics(Instrument):
         if filepath is None:
             return
         self._calibration_file = filepath
-        self.load_calibration(filepath)
+        self._calibration_bytes = self._encode_path(filepath)
+        self.load_calibration()
 
     @property
     def settings_file(self) -> str:
@@ -252,7 +302,8 @@ class Xenics(Instrument):
         if filepath is None:
             return
         self._settings_file = filepath
-        self.load_settings(filepath)
+        self._settings_bytes = self._encode_path(filepath)
+        self.load_settings()
 
     @property
     def frame_size(self) -> int:
@@ -263,8 +314,7 @@ class Xenics(Instrument):
         int
             Frame size in bytes.
         """
-        self._require_open()
-        return int(self._dll.XC_GetFrameSize(self._cam))
+        return self._get_frame_info()[0]
 
     @property
     def frame_dims(self) -> tuple[int, int]:
@@ -275,11 +325,7 @@ class Xenics(Instrument):
         tuple of int
             Frame dimensions as (height, width).
         """
-        self._require_open()
-
-        width = int(self._dll.XC_GetWidth(self._cam))
-        height = int(self._dll.XC_GetHeight(self._cam))
-
+        _, _, height, width = self._get_frame_info()
         return height, width
 
     @property
@@ -291,8 +337,7 @@ class Xenics(Instrument):
         int
             Frame width.
         """
-        self._require_open()
-        return int(self._dll.XC_GetWidth(self._cam))
+        return self._get_frame_info()[3]
 
     @property
     def height(self) -> int:
@@ -303,8 +348,7 @@ class Xenics(Instrument):
         int
             Frame height.
         """
-        self._require_open()
-        return int(self._dll.XC_GetHeight(self._cam))
+        return self._get_frame_info()[2]
 
     @property
     def frame_type(self) -> int:
@@ -315,8 +359,7 @@ class Xenics(Instrument):
         int
             Frame type enumeration.
         """
-        self._require_open()
-        return int(self._dll.XC_GetFrameType(self._cam))
+        return self._get_frame_info()[1]
 
     @property
     def pixel_size(self) -> int:
@@ -333,26 +376,33 @@ class Xenics(Instrument):
             If the frame type is unsupported.
         """
         frame_type = self.frame_type
-
-        pixel_sizes = {
-            -1: 0,  # UNKNOWN
-            0: 0,  # NATIVE
-            1: 1,  # 8 BPP GRAY
-            2: 2,  # 16 BPP GRAY
-            3: 4,  # 32 BPP GRAY
-            4: 4,  # RGBA
-            5: 4,  # RGB
-            6: 4,  # BGRA
-            7: 4,  # BGR
-        }
-
-        try:
-            return pixel_sizes[frame_type]
-        except KeyError:
+        if not -1 <= frame_type < len(self._PIXEL_SIZES) - 1:
             raise XenicsError(
                 code=frame_type,
                 message=f"Unsupported frame type {frame_type}",
             )
+        return self._PIXEL_SIZES[frame_type + 1]
+
+    def _get_frame_info(self) -> tuple[int, int, int, int]:
+        """Return the cached frame geometry, querying the DLL on a miss.
+
+        The values do not change while the camera is open, except when a
+        calibration or settings file is loaded, which clears the cache.
+
+        Returns
+        -------
+        tuple of int
+            Frame size in bytes, frame type, height and width.
+        """
+        self._require_open()
+        if self._frame_info is None:
+            self._frame_info = (
+                int(self._dll.XC_GetFrameSize(self._cam)),
+                int(self._dll.XC_GetFrameType(self._cam)),
+                int(self._dll.XC_GetHeight(self._cam)),
+                int(self._dll.XC_GetWidth(self._cam)),
+            )
+        return self._frame_info
 
     def _require_open(self) -> None:
         """Check that camera is open."""
@@ -382,7 +432,7 @@ class Xenics(Instrument):
         if self._is_open:
             return
 
-        handle = self._dll.XC_OpenCamera(self._url.encode("utf-8"), 0, 0)
+        handle = self._dll.XC_OpenCamera(self._url_bytes, 0, 0)
         if handle == 0:
             logger.error("Xenics handle is NULL.")
             raise Exception("Xenics handle is NULL.")
@@ -398,7 +448,7 @@ class Xenics(Instrument):
         logger.debug(f"Connection is OK.")
 
     def close(self) -> None:
-        """Stop capture (if running) and close the camera."""
+        """Stop capture (if running), finish pending saves and close the camera."""
         if not self._is_open:
             return
 
@@ -406,14 +456,19 @@ class Xenics(Instrument):
             if self._is_capturing:
                 self.stop_capture()
                 self._is_capturing = False
+            self.flush()
 
         except BaseException:
             logger.error("Something went wrong closing the camera.")
             raise
 
         finally:
+            if self._save_pool is not None:
+                self._save_pool.shutdown(wait=True)
+                self._save_pool = None
             self._dll.XC_CloseCamera(self._cam)
             self._cam = None
+            self._frame_info = None
             self._is_open = False
             logger.info("Camera connection has been closed.")
 
@@ -435,6 +490,7 @@ class Xenics(Instrument):
         if not self._is_capturing:
             return
 
+        self.stop_stream()
         self._dll._check_error(self._dll.XC_StopCapture(self._cam))
         self._is_capturing = False
         logger.info("Stop capturing.")
@@ -446,10 +502,15 @@ class Xenics(Instrument):
             return
         else:
             flag = 1  # Use software correction
+            if filename is None:
+                fname_bytes = self._calibration_bytes
+            else:
+                fname_bytes = self._encode_path(filename)
             self._dll._check_error(
-                self._dll.XC_LoadCalibration(self._cam, str(fname).encode(), flag)
+                self._dll.XC_LoadCalibration(self._cam, fname_bytes, flag)
             )
-            logger.debug(f"Calibration file {fname.encode()} has been loaded.")
+            self._frame_info = None
+            logger.debug(f"Calibration file {fname} has been loaded.")
 
     def load_settings(self, filename: str | None = None) -> None:
         fname = filename if filename is not None else self.settings_file
@@ -457,21 +518,34 @@ class Xenics(Instrument):
             # LOG no setting loaded.
             return
         else:
-            self._dll._check_error(self._dll.XC_LoadSettings(self._cam, fname.encode()))
-            logger.debug(f"Setting file {fname.encode()} has been loaded.")
-
-    def grab_frame(self, filename: str):
+            if filename is None:
+                fname_bytes = self._settings_bytes
+            else:
+                fname_bytes = self._encode_path(filename)
+            self._dll._check_error(self._dll.XC_LoadSettings(self._cam, fname_bytes))
+            self._frame_info = None
+            logger.debug(f"Setting file {fname} has been loaded.")
+
+    def grab_frame(self, filename: str, copy: bool = True):
         """Acquire a single frame and save it to disk.
 
+        The file is written in the background; call `flush` to wait for it.
+
         Parameters
         ----------
         filename : str
             Output image filename.
+        copy : bool, optional
+            If ``False``, return a view of the internal frame buffer instead
+            of a copy. The view is overwritten by the next call, so copy it
+            before grabbing again if it must be kept. Default is ``True``.
 
         Returns
         -------
         numpy.ndarray
-            Acquired frame as a NumPy array.
+            Acquired frame as a NumPy array. With ``copy=True`` it is
+            read-only, since the same array is being saved in the
+            background; copy it before modifying.
 
         Raises
         ------
@@ -481,38 +555,174 @@ class Xenics(Instrument):
 
         self._require_capturing()
 
-        frame_size = self.frame_size
-        frame_t = self.frame_type
-        height, width = self.frame_dims
+        frame_size, frame_t, height, width = self._get_frame_info()
         pixel_dtype = self.get_pixel_dtype()
         pixel_size = self.pixel_size
 
-        buffer = bytes(frame_size)
+        if self._frame_buf is None or len(self._frame_buf) != frame_size:
+            self._frame_buf = (ctypes.c_uint8 * frame_size)()
 
-        self._dll.get_frame(self._cam, frame_t, 1, buffer, frame_size)
+        self._dll.get_frame(self._cam, frame_t, 1, self._frame_buf, frame_size)
 
-        frame = np.frombuffer(
-            buffer,
-            dtype=pixel_dtype,
-            count=frame_size // pixel_size,
-        ).reshape((height, width))
-
-        Image.fromarray(frame).save(filename)
+        frame = (
+            np.ctypeslib.as_array(self._frame_buf)[: height * width * pixel_size]
+            .view(pixel_dtype)
+            .reshape((height, width))
+        )
+        if copy:
+            # The one copy is both returned and saved, so it is read-only
+            frame = frame.copy()
+            frame.setflags(write=False)
+            to_save = frame
+        else:
+            to_save = frame.copy()  # frame is overwritten by the next grab
+
+        # PIL releases the GIL while encoding, so saving overlaps the next grab
+        if self._save_pool is None:
+            self._save_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_saves = [f for f in self._pending_saves if not f.done()]
+        self._pending_saves.append(
+            self._save_pool.submit(_save_image, to_save, filename)
+        )
         logger.info('Grabbed frame.')
         return frame
 
-    def get_pixel_dtype(self):
+    def flush(self) -> None:
+        """Wait until all frames queued by `grab_frame` are written to disk.
+
+        Raises
+        ------
+        Exception
+            The first error raised while saving a frame, if any.
+        """
+        pending, self._pending_saves = self._pending_saves, []
+        for future in pending:
+            future.result()
+
+    def start_stream(self, n_buffers: int = 4) -> None:
+        """Start grabbing frames continuously in a background thread.
+
+        A producer thread fills a ring of ``n_buffers`` preallocated frames
+        while the caller consumes earlier ones with `read_frame`, so the
+        wait on the camera overlaps with processing. `grab_frame` must not
+        be used while streaming.
+
+        Parameters
+        ----------
+        n_buffers : int, optional
+            Number of frames in the ring. Default is 4.
+        """
+        self._require_capturing()
+        if self._stream_thread is not None:
+            if self._stream_thread.is_alive():
+                return
+            self.stop_stream()  # the producer died on an error, restart it
+
+        frame_size, frame_t, height, width = self._get_frame_info()
+        pixel_dtype = self.get_pixel_dtype()
+        n_pixel_bytes = height * width * self.pixel_size
+        # Each slot holds a whole SDK frame, as in grab_frame; the pixel view
+        # covers its first height*width*pixel_size bytes
+        self._ring = [np.empty(frame_size, dtype=np.uint8) for _ in range(n_buffers)]
+        self._ring_frames = [
+            buf[:n_pixel_bytes].view(pixel_dtype).reshape((height, width))
+            for buf in self._ring
+        ]
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for idx in range(n_buffers):
+            self._free.put(idx)
+
+        self._stream_stop.clear()
+        self._stream_error = None
+        self._stream_thread = threading.Thread(
+            target=self._stream_loop, args=(frame_t,), daemon=True
+        )
+        self._stream_thread.start()
+        logger.info("Start streaming.")
+
+    def _stream_loop(self, frame_t: int) -> None:
+        """Producer loop run by the streaming thread."""
+        try:
+            while not self._stream_stop.is_set():
+                try:
+                    idx = self._free.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                buf = self._ring[idx]
+                self._dll.get_frame(self._cam, frame_t, 1, buf.ctypes.data, buf.size)
+                self._ready.put(idx)
+        except BaseException as e:
+            self._stream_error = e
+            self._ready.put(None)
+
+    def read_frame(self, timeout: float | None = None) -> np.ndarray:
+        """Return the oldest frame grabbed by the streaming thread.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for a frame. ``None`` waits indefinitely.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of the frame; its ring slot is handed back to the producer.
+
+        Raises
+        ------
+        RuntimeError
+            If streaming is not running.
+        queue.Empty
+            If no frame arrives within ``timeout``.
+        XenicsError
+            If the producer failed to grab a frame. Raised again on every
+            call until the stream is restarted or stopped.
+        """
+        if self._stream_thread is None:
+            raise RuntimeError("Camera is not streaming.")
+        if self._stream_error is not None:
+            raise self._stream_error
+        idx = self._ready.get(timeout=timeout)
+        if idx is None:
+            raise self._stream_error
+        frame = self._ring_frames[idx].copy()
+        self._free.put(idx)
+        return frame
+
+    def stop_stream(self) -> None:
+        """Stop the streaming thread started by `start_stream`."""
+        if self._stream_thread is None:
+            return
+        self._stream_stop.set()
+        self._stream_thread.join()
+        self._stream_thread = None
+        self._ring = []
+        self._ring_frames = []
+        logger.info("Stop streaming.")
+
+    def get_pixel_dtype(self) -> type:
+        """Return the NumPy dtype matching the camera pixel size.
+
+        Returns
+        -------
+        type
+            One of ``numpy.uint8``, ``numpy.uint16`` or ``numpy.uint32``.
+
+        Raises
+        ------
+        XenicsError
+            If the frame type has no fixed pixel size (e.g. NATIVE).
+        """
         bytes_in_pixel = self.pixel_size
-        conversions = (None, np.uint8, np.uint16, None, np.uint32)
         try:
-            pixel_dtype = conversions[bytes_in_pixel]
-        except BaseException:
-            logger.error("Unsupported pixel size %s" % str(bytes_in_pixel))
-            raise Exception("Unsupported pixel size %s" % str(bytes_in_pixel))
-        if conversions is None:
-            logger.error("Unsupported pixel size %s" % str(bytes_in_pixel))
-            raise Exception("Unsupported pixel size %s" % str(bytes_in_pixel))
-        return pixel_dtype
+            return self._PIXEL_DTYPES[bytes_in_pixel]
+        except KeyError:
+            logger.error("Unsupported pixel size %s", bytes_in_pixel)
+            raise XenicsError(
+                code=self.frame_type,
+                message=f"Unsupported pixel size {bytes_in_pixel}",
+            )
 
 
 if __name__ == "__main__":
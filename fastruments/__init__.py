@@ -14,12 +14,7 @@ for h in logger.handlers[:]:
     logger.removeHandler(h)
     h.close()
 
-_ch1 = logging.StreamHandler(sys.stdout)
-_ch1.setLevel(logging.INFO)
-_ch1.setFormatter(CustomConsoleFormatter())
-_ch1.addFilter(lambda record: record.levelno <= logging.INFO)
-logger.addHandler(_ch1)
-_ch2 = logging.StreamHandler(sys.stdout)
-_ch2.setLevel(logging.WARNING)
-_ch2.setFormatter(CustomConsoleFormatter())
-logger.addHandler(_ch2)
\ No newline at end of file
+_ch = logging.StreamHandler(sys.stdout)
+_ch.setLevel(logging.INFO)
+_ch.setFormatter(CustomConsoleFormatter())
+logger.addHandler(_ch)
@@ -1,9 +1,13 @@
 """Helper functions"""
 
+from typing import Any
 from typing import Optional
 from typing import Tuple
 from typing import Protocol
+import asyncio
 import ctypes
+import threading
+import time
 from fastruments import logger
 
 
@@ -34,3 +38,167 @@ class DllBinder:
 
         setattr(target, name, func)
         logger.debug(f"Bind {name} function.")
+
+
+_RM = None  # process-wide VISA resource manager, see get_rm
+
+
+def get_rm() -> Any:
+    """Return the process-wide VISA Resource Manager.
+
+    It is created on first use and shared by every VISA driver of the
+    package, so a process controlling several instruments opens only one.
+
+    Returns
+    -------
+    pyvisa.ResourceManager
+        The shared Resource Manager.
+    """
+    global _RM
+    if _RM is None:
+        import pyvisa  # only the VISA drivers need it
+
+        _RM = pyvisa.ResourceManager()
+    return _RM
+
+
+def shutdown_rm() -> None:
+    """Close the process-wide VISA Resource Manager.
+
+    Any instrument still connected through it becomes unusable. The next
+    call to `get_rm` creates a fresh Resource Manager.
+    """
+    global _RM
+    if _RM is not None:
+        _RM.close()
+        _RM = None
+
+
+def enable_srq(inst: Any) -> bool:
+    """Start queueing service-request events on a VISA session.
+
+    Call it *before* the write that ends with *OPC: VISA only queues the
+    events that occur after they are enabled, so an operation completing
+    between the write and `wait_for_opc` would otherwise go unnoticed.
+
+    Parameters
+    ----------
+    inst : pyvisa.resources.MessageBasedResource
+        Open VISA session.
+
+    Returns
+    -------
+    bool
+        ``True`` if the session queues service requests, ``False`` if it
+        does not support them (`wait_for_opc` then polls *ESR?).
+    """
+    import pyvisa  # only the VISA drivers need it
+
+    try:
+        inst.enable_event(
+            pyvisa.constants.EventType.service_request,
+            pyvisa.constants.EventMechanism.queue,
+        )
+    except (AttributeError, NotImplementedError, pyvisa.errors.VisaIOError):
+        return False
+    return True
+
+
+def wait_for_opc(inst: Any, timeout: float, name: str, srq: bool = False) -> None:
+    """Wait for the Operation Complete event of a pending *OPC.
+
+    The event status register is checked first, so an operation that has
+    already completed returns at once. Otherwise the wait proceeds in slices
+    of at most 100 ms, on the service-request queue when `srq` is set or with
+    an exponential backoff otherwise, re-reading *ESR? after each slice; a
+    KeyboardInterrupt is therefore handled within a slice. Reading *ESR?
+    also clears the OPC bit for the next operation.
+
+    Parameters
+    ----------
+    inst : pyvisa.resources.MessageBasedResource
+        Open VISA session with *ESE bit 0 (OPC) enabled.
+    timeout : float
+        Maximum waiting time in seconds.
+    name : str
+        Instrument name used in the error message.
+    srq : bool, optional
+        Whether `enable_srq` succeeded before the *OPC write.
+
+    Raises
+    ------
+    TimeoutError
+        If the operation does not complete within `timeout`.
+    """
+    import pyvisa  # only the VISA drivers need it
+
+    srq_event = pyvisa.constants.EventType.service_request
+    deadline = time.monotonic() + timeout
+    delay = 1e-3
+    try:
+        while not int(inst.query("*ESR?")) & 1:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"[{name}][ERROR] Operation not completed within {timeout} s."
+                )
+            if srq:
+                slice_ms = max(1, int(min(remaining, 0.1) * 1000))
+                inst.wait_on_event(srq_event, slice_ms, capture_timeout=True)
+            else:
+                time.sleep(min(delay, remaining))
+                delay = min(2 * delay, 0.1)
+    finally:
+        if srq:
+            inst.disable_event(srq_event, pyvisa.constants.EventMechanism.queue)
+            inst.discard_events(srq_event, pyvisa.constants.EventMechanism.queue)
+
+
+class AsyncInstrument:
+    """Asyncio facade over a blocking instrument driver.
+
+    Every method of the wrapped driver is exposed as a coroutine that runs
+    the blocking call in a worker thread (``asyncio.to_thread``), so the
+    SCPI latencies of several instruments can overlap. Calls on the same
+    instrument are serialized by a lock, since a VISA session is not meant
+    to be shared by concurrent transactions.
+
+    Properties of the driver may query the instrument too, so reading one
+    returns an awaitable that runs the getter the same way (see `aget`).
+    Other plain attributes are returned as they are.
+
+    Examples
+    --------
+    >>> afg = AsyncInstrument(AFG3011C(resource))
+    >>> await asyncio.gather(afg.set_frequency(1e3), smu.set_source(...))
+    >>> size = await cam.frame_size
+    """
+
+    def __init__(self, instrument: Any) -> None:
+        self.instrument = instrument
+        self._lock = threading.Lock()
+
+    async def aget(self, name: str) -> Any:
+        """Read an attribute of the driver in a worker thread, under the lock."""
+
+        def locked() -> Any:
+            with self._lock:
+                return getattr(self.instrument, name)
+
+        return await asyncio.to_thread(locked)
+
+    def __getattr__(self, name: str) -> Any:
+        if isinstance(getattr(type(self.instrument), name, None), property):
+            return self.aget(name)
+        attr = getattr(self.instrument, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(locked, *args, **kwargs)
+
+        return call
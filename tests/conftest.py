@@ -0,0 +1,14 @@
+import os
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# The drivers import their siblings (``helpers``, ``Instrument``) as top-level
+# modules, and the package logger as ``fastruments``.
+sys.path.insert(0, str(ROOT / "fastruments"))
+sys.path.insert(0, str(ROOT))
+
+# SantecOPM150 registers its DLL directory at import time (Windows only).
+if not hasattr(os, "add_dll_directory"):
+    os.add_dll_directory = lambda path: None
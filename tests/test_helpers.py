@@ -0,0 +1,58 @@
+import asyncio
+import threading
+
+from helpers import AsyncInstrument
+
+
+class _Driver:
+    label = "driver"
+
+    def __init__(self):
+        self.facade = None
+        self.calls = []
+
+    @property
+    def reading(self):
+        self.calls.append((threading.current_thread(), self.facade._lock.locked()))
+        return 42
+
+    def measure(self, value):
+        self.calls.append((threading.current_thread(), self.facade._lock.locked()))
+        return value
+
+
+def _run(coro_factory):
+    driver = _Driver()
+    driver.facade = AsyncInstrument(driver)
+
+    async def main():
+        return threading.current_thread(), await coro_factory(driver.facade)
+
+    loop_thread, result = asyncio.run(main())
+    return driver, loop_thread, result
+
+
+def test_property_read_runs_off_the_loop_under_the_lock():
+    driver, loop_thread, result = _run(lambda facade: facade.reading)
+    assert result == 42
+    ((thread, locked),) = driver.calls
+    assert thread is not loop_thread
+    assert locked
+
+
+def test_aget_reads_property_off_the_loop():
+    driver, loop_thread, result = _run(lambda facade: facade.aget("reading"))
+    assert result == 42
+    assert driver.calls[0][0] is not loop_thread
+
+
+def test_method_call_runs_off_the_loop_under_the_lock():
+    driver, loop_thread, result = _run(lambda facade: facade.measure(7))
+    assert result == 7
+    ((thread, locked),) = driver.calls
+    assert thread is not loop_thread
+    assert locked
+
+
+def test_plain_attribute_is_returned_directly():
+    assert AsyncInstrument(_Driver()).label == "driver"
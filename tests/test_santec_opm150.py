@@ -0,0 +1,95 @@
+import ctypes
+import types
+
+import numpy as np
+import pytest
+
+import SantecOPM150
+from SantecOPM150 import OPM150
+from SantecOPM150 import SantecDLL
+
+_DESCRIPTION = b"OP710 test"
+
+
+class _Recorder:
+    """Stand-in CDLL that records the prototypes set by the binder."""
+
+    def __getattr__(self, name):
+        func = types.SimpleNamespace()
+        setattr(self, name, func)
+        return func
+
+
+def _stub_dll(**impls) -> SantecDLL:
+    """SantecDLL whose entry points are C callbacks with the real argtypes."""
+    dll = SantecDLL.__new__(SantecDLL)
+    dll._dll = _Recorder()
+    dll._bind_functions()
+    for name, impl in impls.items():
+        proto = getattr(dll._dll, name)
+        cfunc = ctypes.CFUNCTYPE(proto.restype, *proto.argtypes)(impl)
+        setattr(dll, f"_cb_{name}", cfunc)  # keep the callback alive
+        setattr(dll, name, cfunc)
+    return dll
+
+
+def _device_count(count):
+    count[0] = 1
+    return 0
+
+
+def _device_description(dev_number, desc):
+    desc[0] = _DESCRIPTION
+    return 0
+
+
+def _open_usb_device(dev_number, handle):
+    handle[0] = 42
+    return 0
+
+
+def _make_meter(read_channel_buffer, **kwargs) -> OPM150:
+    dll = _stub_dll(
+        GetUSBDeviceCount=_device_count,
+        GetUSBDeviceDescription=_device_description,
+        OpenUSBDevice=_open_usb_device,
+        OpenDriver=lambda handle: 0,
+        GetChannelBuffer=lambda: 0,
+        ReadChannelBuffer=read_channel_buffer,
+    )
+    return OPM150(dll=dll, verbose=False, power_unit=0, **kwargs)
+
+
+def _read_ok(ch, power):
+    power[0] = -float(ch)
+    return 0
+
+
+def test_read_channel_buffers_fills_slots():
+    dll = _stub_dll(ReadChannelBuffer=_read_ok)
+    out = (ctypes.c_double * 24)()
+    assert dll.read_channel_buffers((3, 5, 7), out) == (0, 0)
+    assert list(out[:3]) == [-3.0, -5.0, -7.0]
+
+
+def test_read_power_array():
+    meter = _make_meter(_read_ok)
+    powers = meter.read_power_array(sleep=0)
+    np.testing.assert_array_equal(powers, -np.arange(1, 25, dtype=np.float64))
+    assert meter.read_power([2, 4], sleep=0) == [-2.0, -4.0]
+
+
+def _read_fail_ch3(ch, power):
+    return SantecOPM150.ErrorCodes.IO_ERROR if ch == 3 else _read_ok(ch, power)
+
+
+def test_read_power_array_reports_failed_channel():
+    meter = _make_meter(_read_fail_ch3)
+    with pytest.raises(Exception, match=r"ch=3.*IO_ERROR"):
+        meter.read_power_array(sleep=0)
+
+
+def test_unchecked_meter_ignores_error_codes():
+    meter = _make_meter(_read_fail_ch3, checked=False)
+    meter.read_power_array(sleep=0)
+    assert _make_meter(_read_ok).checked